@@ -1,7 +1,8 @@
 """Базовая схема для работы с фильтрами, сортировкой и пагинацией"""
 
+from collections.abc import Mapping
 from enum import StrEnum
-from typing import Any, TypeVar, cast
+from typing import Any, ClassVar, TypeVar, cast
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -26,6 +27,7 @@ class DPFilters[SortFieldType](BaseModel):
         sort: Параметры сортировки (один объект Sort или список для множественной сортировки)
         limit: Максимальное количество записей для возврата (от 1 до 1000)
         offset: Количество записей для пропуска (от 0 и выше)
+        sort_map: Соответствие поле сортировки -> колонка модели (атрибут класса)
 
     Examples:
 
@@ -76,6 +78,13 @@ class DPFilters[SortFieldType](BaseModel):
         default=None, ge=0, description="Количество записей для пропуска (от 0 и выше)"
     )
 
+    sort_map: ClassVar[Mapping[Any, Any]] = {}
+    """
+    Соответствие значений enum сортировки колонкам модели.
+    Если поле сортировки есть в sort_map, DPService берёт колонку отсюда,
+    иначе ищет атрибут модели по sort_field.value.
+    """
+
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
         extra="forbid",
@@ -1,10 +1,25 @@
 """Базовый репозиторий для работы с SQLAlchemy моделями"""
 
-from typing import Any
-
-from sqlalchemy import ColumnElement, and_, delete, exists, func, select, update
+from collections.abc import AsyncIterator, Sequence
+from itertools import batched
+from typing import Any, cast
+
+from sqlalchemy import (
+    ColumnElement,
+    CursorResult,
+    RowMapping,
+    Select,
+    and_,
+    delete,
+    exists,
+    func,
+    inspect,
+    select,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.orm import InstrumentedAttribute, Mapper
+from sqlalchemy.orm.interfaces import ORMOption
 
 from dplex.internal.query_builder import QueryBuilder
 
@@ -23,6 +38,22 @@ class DPRepo[ModelType, KeyType]:
         model: Класс SQLAlchemy модели
         session: Асинхронная сессия SQLAlchemy
         id_field_name: Имя поля первичного ключа в модели
+        max_in_params: Максимум значений в одном IN (...) для find_by_ids
+        load_options: Опции загрузки, применяемые ко всем SELECT запросам
+    """
+
+    max_in_params: int = 900
+    """
+    Максимальное количество значений в одном условии IN (...).
+    Большие списки ID разбиваются на пачки такого размера, чтобы не упереться
+    в лимит bind-параметров драйвера (SQLite до 3.32 — 999, asyncpg — 32767).
+    """
+
+    load_options: tuple[ORMOption, ...] = ()
+    """
+    Опции загрузки, добавляемые к каждому SELECT запросу репозитория.
+    Наследник может указать, например, (selectinload(User.orders),), чтобы
+    связи загружались вместе со списком, а не отдельным запросом на строку.
     """
 
     def __init__(
@@ -49,6 +80,7 @@ class DPRepo[ModelType, KeyType]:
         self.session = session
         self.id_field_name = id_field_name
         self._id_column = self._get_id_column()
+        self._id_is_primary_key = self._is_single_primary_key()
 
     def _get_id_column(self) -> InstrumentedAttribute[KeyType]:
         """
@@ -75,6 +107,24 @@ class DPRepo[ModelType, KeyType]:
 
         return column
 
+    def _is_single_primary_key(self) -> bool:
+        """
+        Проверить, является ли ID колонка единственным первичным ключом модели
+
+        Только в этом случае поиск по ID можно выполнять через session.get().
+
+        Returns:
+            True если id_field_name указывает на единственный PK модели
+        """
+        mapper = inspect(self.model)
+        if not isinstance(mapper, Mapper):
+            return False
+        primary_key = mapper.primary_key
+        columns: Sequence[Any] = getattr(self._id_column.property, "columns", ())
+        if len(primary_key) != 1 or len(columns) != 1:
+            return False
+        return columns[0] is primary_key[0]
+
     def query(self) -> "QueryBuilder[ModelType]":
         """
         Создать типизированный query builder
@@ -111,6 +161,9 @@ class DPRepo[ModelType, KeyType]:
     async def find_by_id(self, entity_id: KeyType) -> ModelType | None:
         """
         Найти сущность по ID
+        Если id_field_name — единственный первичный ключ модели, используется
+        session.get(): сущность, уже загруженная в сессию, возвращается из
+        identity map без запроса к БД.
 
         Args:
             entity_id: ID сущности
@@ -118,11 +171,17 @@ class DPRepo[ModelType, KeyType]:
         Returns:
             Модель или None если не найдена
         """
+        if self._id_is_primary_key:
+            return await self.session.get(
+                self.model, entity_id, options=self.load_options
+            )
         return await self.query().where(self.id_eq(entity_id)).find_one()
 
     async def find_by_ids(self, entity_ids: list[KeyType]) -> list[ModelType]:
         """
         Найти сущности по списку ID
+        Выполняет один запрос WHERE id IN (...). Списки длиннее max_in_params
+        разбиваются на несколько запросов по max_in_params значений.
 
         Args:
             entity_ids: Список ID сущностей
@@ -136,7 +195,15 @@ class DPRepo[ModelType, KeyType]:
         if not entity_ids:
             raise ValueError("DPRepo.find_by_ids: Список ID не может быть пустым")
 
-        return await self.query().where(self.id_in(entity_ids)).find_all()
+        if len(entity_ids) <= self.max_in_params:
+            return await self.query().where(self.id_in(entity_ids)).find_all()
+
+        # Убираем дубликаты, чтобы одна запись не попала в результат из двух пачек
+        unique_ids = list(dict.fromkeys(entity_ids))
+        models: list[ModelType] = []
+        for batch in batched(unique_ids, self.max_in_params):
+            models.extend(await self.query().where(self.id_in(list(batch))).find_all())
+        return models
 
     async def delete_by_query_builder(
         self,
@@ -164,20 +231,22 @@ class DPRepo[ModelType, KeyType]:
         stmt = delete(self.model).where(condition)
         await self.session.execute(stmt)
 
-    async def delete_by_id(self, entity_id: KeyType) -> None:
+    async def delete_by_id(self, entity_id: KeyType) -> bool:
         """
         Удалить сущность по ID
+        Результат берётся из rowcount самого DELETE, без проверочного SELECT.
 
         Args:
             entity_id: ID сущности для удаления
 
         Returns:
-            None
+            True если сущность была удалена, False если она не найдена
         """
         stmt = delete(self.model).where(self.id_eq(entity_id))
-        await self.session.execute(stmt)
+        result = cast(CursorResult[Any], await self.session.execute(stmt))
+        return result.rowcount > 0
 
-    async def delete_by_ids(self, entity_ids: list[KeyType]) -> None:
+    async def delete_by_ids(self, entity_ids: list[KeyType]) -> int:
         """
         Удалить сущности по списку ID
 
@@ -185,7 +254,7 @@ class DPRepo[ModelType, KeyType]:
             entity_ids: Список ID сущностей для удаления
 
         Returns:
-            None
+            Количество удалённых записей (rowcount DELETE)
 
         Raises:
             ValueError: Если список ID пустой
@@ -194,7 +263,8 @@ class DPRepo[ModelType, KeyType]:
             raise ValueError("DPRepo.delete_by_ids: Список ID не может быть пустым")
 
         stmt = delete(self.model).where(self.id_in(entity_ids))
-        await self.session.execute(stmt)
+        result = cast(CursorResult[Any], await self.session.execute(stmt))
+        return result.rowcount
 
     async def update(
         self,
@@ -314,6 +384,82 @@ class DPRepo[ModelType, KeyType]:
         stmt = update(self.model).where(self.id_in(entity_ids)).values(**values)
         await self.session.execute(stmt)
 
+    async def update_by_id_returning(
+        self, entity_id: KeyType, values: dict[str, Any]
+    ) -> ModelType | None:
+        """
+        Обновить сущность по ID и вернуть обновлённую модель
+
+        Args:
+            entity_id: ID сущности
+            values: Словарь с обновляемыми полями и значениями
+
+        Returns:
+            Обновлённая модель или None если сущность не найдена
+
+        Raises:
+            ValueError: Если values пустой
+        """
+        if not values:
+            raise ValueError(
+                "DPRepo.update_by_id_returning: Данные для обновления не могут быть пустыми"
+            )
+
+        models = await self._update_returning(self.id_eq(entity_id), values)
+        return models[0] if models else None
+
+    async def update_by_ids_returning(
+        self, entity_ids: list[KeyType], values: dict[str, Any]
+    ) -> list[ModelType]:
+        """
+        Обновить сущности по списку ID и вернуть обновлённые модели
+
+        Args:
+            entity_ids: Список ID сущностей
+            values: Словарь с обновляемыми полями и значениями
+
+        Returns:
+            Список обновлённых моделей
+
+        Raises:
+            ValueError: Если entity_ids или values пустые
+        """
+        if not entity_ids:
+            raise ValueError(
+                "DPRepo.update_by_ids_returning: Список ID не может быть пустым"
+            )
+
+        if not values:
+            raise ValueError(
+                "DPRepo.update_by_ids_returning: Данные для обновления не могут быть пустыми"
+            )
+
+        return await self._update_returning(self.id_in(entity_ids), values)
+
+    async def _update_returning(
+        self, condition: ColumnElement[bool], values: dict[str, Any]
+    ) -> list[ModelType]:
+        """
+        UPDATE по условию с возвратом обновлённых моделей
+        Если диалект поддерживает UPDATE ... RETURNING (PostgreSQL, SQLite 3.35+),
+        строки возвращаются тем же запросом. Иначе после UPDATE выполняется
+        SELECT по тому же условию.
+
+        Args:
+            condition: Условие WHERE
+            values: Словарь с обновляемыми полями и значениями
+
+        Returns:
+            Список обновлённых моделей
+        """
+        stmt = update(self.model).where(condition).values(**values)
+        if self.session.get_bind().dialect.update_returning:
+            result = await self.session.scalars(stmt.returning(self.model))
+            return list(result.all())
+
+        await self.session.execute(stmt)
+        return await self.query().where(condition).find_all()
+
     async def exists_by_id(self, entity_id: KeyType) -> bool:
         """
         Проверить существование сущности по ID.
@@ -398,25 +544,45 @@ class DPRepo[ModelType, KeyType]:
             return and_(*builder.filters)
         return None
 
-    async def execute_typed_query(
-        self, builder: "QueryBuilder[ModelType]"
-    ) -> list[ModelType]:
+    def _has_load_options(self, builder: "QueryBuilder[ModelType]") -> bool:
         """
-        Выполнить типизированный запрос из QueryBuilder
-        Применяет все условия фильтрации, сортировки и пагинации из builder.
+        Проверить, заданы ли опции загрузки в репозитории или в builder
 
         Args:
             builder: QueryBuilder с параметрами запроса
 
         Returns:
-            Список найденных моделей
+            True если к запросу будут добавлены опции загрузки
         """
-        stmt = select(self.model)
+        return bool(self.load_options or builder.load_options)
+
+    def _build_select(
+        self,
+        builder: "QueryBuilder[ModelType]",
+        columns: Sequence[InstrumentedAttribute[Any]] = (),
+    ) -> Select[Any]:
+        """
+        Построить SELECT из QueryBuilder
+        Применяет условия фильтрации, опции загрузки репозитория (load_options)
+        и builder, сортировку и пагинацию.
+
+        Args:
+            builder: QueryBuilder с параметрами запроса
+            columns: Колонки для выборки. Если не заданы, выбирается модель целиком
+                (опции загрузки применяются только в этом случае)
+
+        Returns:
+            SQLAlchemy Select по модели или по указанным колонкам
+        """
+        stmt: Select[Any] = select(*columns) if columns else select(self.model)
 
         condition = self._build_where_clause_from_builder(builder)
         if condition is not None:
             stmt = stmt.where(condition)
 
+        if not columns and self._has_load_options(builder):
+            stmt = stmt.options(*self.load_options, *builder.load_options)
+
         if builder.order_by_clauses:
             stmt = stmt.order_by(*builder.order_by_clauses)
 
@@ -426,8 +592,116 @@ class DPRepo[ModelType, KeyType]:
         if builder.offset_value is not None:
             stmt = stmt.offset(builder.offset_value)
 
-        result = await self.session.scalars(stmt)
-        return list(result.all())
+        return stmt
+
+    async def execute_typed_query(
+        self, builder: "QueryBuilder[ModelType]"
+    ) -> list[ModelType]:
+        """
+        Выполнить типизированный запрос из QueryBuilder
+        Применяет все условия фильтрации, сортировки и пагинации из builder,
+        а также опции загрузки репозитория (load_options) и builder.
+
+        Args:
+            builder: QueryBuilder с параметрами запроса
+
+        Returns:
+            Список найденных моделей
+        """
+        result = await self.session.scalars(self._build_select(builder))
+        # joinedload по коллекции повторяет строку сущности на каждый элемент
+        # связи: unique() оставляет каждую сущность один раз
+        if self._has_load_options(builder):
+            result = result.unique()
+        return cast(list[ModelType], list(result.all()))
+
+    async def execute_typed_mappings(
+        self,
+        builder: "QueryBuilder[ModelType]",
+        columns: Sequence[InstrumentedAttribute[Any]],
+    ) -> list[RowMapping]:
+        """
+        Выполнить запрос из QueryBuilder, выбирая только указанные колонки
+        Строки возвращаются как словари {имя_колонки: значение} без создания
+        ORM объектов и без регистрации в identity map.
+
+        Args:
+            builder: QueryBuilder с параметрами запроса
+            columns: Колонки модели для выборки
+
+        Returns:
+            Список строк в виде RowMapping
+
+        Raises:
+            ValueError: Если список колонок пустой
+        """
+        if not columns:
+            raise ValueError(
+                "DPRepo.execute_typed_mappings: Список колонок не может быть пустым"
+            )
+
+        result = await self.session.execute(self._build_select(builder, columns))
+        return list(result.mappings().all())
+
+    async def execute_typed_query_with_total(
+        self, builder: "QueryBuilder[ModelType]"
+    ) -> tuple[list[ModelType], int | None]:
+        """
+        Выполнить запрос из QueryBuilder и вернуть общее количество записей
+        Количество считается оконной функцией COUNT(*) OVER () в том же SELECT,
+        поэтому страница и итог получаются за один запрос. Окно вычисляется
+        до LIMIT/OFFSET, то есть равно количеству записей без пагинации.
+        При опциях загрузки (load_options) JOIN может размножить строки,
+        поэтому количество считается отдельным COUNT запросом.
+
+        Args:
+            builder: QueryBuilder с параметрами запроса
+
+        Returns:
+            Кортеж (список моделей, общее количество). Если страница пуста,
+            количество неизвестно и возвращается None
+        """
+        if self._has_load_options(builder):
+            models = await self.execute_typed_query(builder)
+            if not models:
+                return [], None
+            return models, await self.execute_typed_count(builder)
+
+        stmt = self._build_select(builder).add_columns(func.count().over())
+        result = await self.session.execute(stmt)
+        rows = result.all()
+        if not rows:
+            return [], None
+        return cast(list[ModelType], [row[0] for row in rows]), rows[0][1]
+
+    async def stream_typed_query(
+        self, builder: "QueryBuilder[ModelType]", chunk_size: int = 1000
+    ) -> AsyncIterator[list[ModelType]]:
+        """
+        Выполнить запрос из QueryBuilder и отдавать результат частями
+        Строки читаются с серверного курсора (yield_per), поэтому в памяти
+        одновременно находится не больше chunk_size моделей.
+
+        Args:
+            builder: QueryBuilder с параметрами запроса
+            chunk_size: Количество моделей в одной части
+
+        Yields:
+            Списки моделей длиной не больше chunk_size
+
+        Raises:
+            ValueError: Если chunk_size меньше 1
+        """
+        if chunk_size < 1:
+            raise ValueError("DPRepo.stream_typed_query: chunk_size должен быть >= 1")
+
+        stmt = self._build_select(builder).execution_options(yield_per=chunk_size)
+        result = await self.session.stream_scalars(stmt)
+        try:
+            async for partition in result.partitions():
+                yield cast(list[ModelType], list(partition))
+        finally:
+            await result.close()
 
     async def execute_typed_count(self, builder: "QueryBuilder[ModelType]") -> int:
         """
@@ -448,3 +722,24 @@ class DPRepo[ModelType, KeyType]:
 
         result = await self.session.execute(stmt)
         return result.scalar_one()
+
+    async def execute_typed_exists(self, builder: "QueryBuilder[ModelType]") -> bool:
+        """
+        Проверить существование записей через типизированный QueryBuilder
+        Применяет только условия фильтрации из builder. Использует EXISTS:
+        БД останавливается на первой подходящей строке, не считая остальные.
+
+        Args:
+            builder: QueryBuilder с условиями фильтрации
+
+        Returns:
+            True если хотя бы одна запись найдена, иначе False
+        """
+        subquery = select(self._id_column)
+
+        condition = self._build_where_clause_from_builder(builder)
+        if condition is not None:
+            subquery = subquery.where(condition)
+
+        result = await self.session.execute(select(subquery.exists()))
+        return result.scalar() is True
@@ -1,10 +1,14 @@
 """Базовый сервис для бизнес-логики с автоматизацией фильтрации, сортировки и CRUD операций"""
 
+from collections.abc import AsyncIterator, Mapping
 from enum import Enum
+from functools import cache
 from typing import TYPE_CHECKING, Any, cast
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
 from dplex.dp_filters import DPFilters
 from dplex.dp_repo import DPRepo
@@ -16,6 +20,20 @@ if TYPE_CHECKING:
 from dplex.internal.sort import Order, Sort
 
 
+@cache
+def _list_adapter(schema: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    """
+    TypeAdapter для списка схем ответа, создаётся один раз на класс схемы
+
+    Args:
+        schema: Класс Pydantic схемы ответа
+
+    Returns:
+        TypeAdapter(list[schema]) для валидации всего списка за один вызов
+    """
+    return cast(TypeAdapter[list[Any]], TypeAdapter(list[schema]))  # type: ignore[valid-type]
+
+
 class DPService[
     ModelType,
     KeyType,
@@ -45,6 +63,16 @@ class DPService[
         session: Асинхронная SQLAlchemy сессия
         response_schema: Класс Pydantic схемы для ответа
         filter_applier: Экземпляр FilterApplier для применения фильтров
+        response_trusted: Собирать схемы ответа без валидации (см. _model_to_schema)
+    """
+
+    response_trusted: bool = False
+    """
+    Доверять данным из БД при сборке схем ответа.
+    Если True, схема собирается через model_construct из одноимённых атрибутов
+    модели без повторной валидации. Подходит только для плоских схем, поля
+    которых совпадают с атрибутами модели и не требуют преобразования
+    (без алиасов, вложенных схем и валидаторов).
     """
 
     def __init__(
@@ -66,17 +94,31 @@ class DPService[
         self.session = session
         self.response_schema = response_schema
         self.filter_applier = FilterApplier()
+        # Имена полей схемы ответа для сборки через model_construct
+        self._response_fields = tuple(response_schema.model_fields)
+        # Адаптер кэшируется на класс схемы, поэтому создание сервиса его не строит
+        self._response_list_adapter: TypeAdapter[list[ResponseSchemaType]] = (
+            _list_adapter(response_schema)
+        )
 
     # ==================== АВТОМАТИЧЕСКИЕ МЕТОДЫ ====================
     def _model_to_schema(self, model: ModelType) -> ResponseSchemaType:
         """
         Автоматическое преобразование SQLAlchemy модели в Pydantic схему
         Использует model_validate из Pydantic для преобразования.
+        При response_trusted=True данные из БД считаются корректными и схема
+        собирается через model_construct без валидации.
+        Если метод переопределён в наследнике, списки тоже преобразуются
+        через него по одной модели.
         Args:
             model: Экземпляр SQLAlchemy модели
         Returns:
             Экземпляр Pydantic схемы ответа
         """
+        if self.response_trusted:
+            return self.response_schema.model_construct(
+                **{field: getattr(model, field) for field in self._response_fields}
+            )
         return self.response_schema.model_validate(model)
 
     @staticmethod
@@ -308,20 +350,26 @@ class DPService[
         self,
         query_builder: Any,
         sort_list: list[Sort[SortFieldSchemaType]],
+        sort_map: Mapping[Any, Any] | None = None,
     ) -> Any:
         """
         Применить сортировку к query builder
+        Колонка берётся из sort_map, если поле в нём есть, иначе ищется
+        атрибут модели по имени из enum.
         Args:
             query_builder: QueryBuilder для добавления сортировки
             sort_list: Список элементов сортировки
+            sort_map: Соответствие поле сортировки -> колонка (DPFilters.sort_map)
         Returns:
             QueryBuilder с примененной сортировкой
         """
         for sort_item in sort_list:
             if sort_item.by is None:
                 continue
-            column_name = self._sort_field_to_column_name(sort_item.by)
-            column = self._get_model_column(column_name)
+            column = sort_map.get(sort_item.by) if sort_map else None
+            if column is None:
+                column_name = self._sort_field_to_column_name(sort_item.by)
+                column = self._get_model_column(column_name)
             desc_order = sort_item.order == Order.DESC
             # Используем order_by_with_nulls для поддержки nulls placement
             query_builder = query_builder.order_by_with_nulls(
@@ -408,7 +456,10 @@ class DPService[
         # 2. Применяем сортировку из Sort объектов (автоматически из DPFilters)
         sort_list = self._get_sort_from_filter(filter_data)
         if sort_list:
-            query_builder = self._apply_sort_to_query(query_builder, sort_list)
+            # sort_list непуст только для DPFilters
+            query_builder = self._apply_sort_to_query(
+                query_builder, sort_list, cast(DPFilters[Any], filter_data).sort_map
+            )
         # 3. Применяем limit (автоматически из DPFilters)
         if isinstance(filter_data, DPFilters) and filter_data.limit is not None:
             query_builder = query_builder.limit(filter_data.limit)
@@ -420,12 +471,27 @@ class DPService[
     def _models_to_schemas(self, models: list[ModelType]) -> list[ResponseSchemaType]:
         """
         Преобразовать список моделей в список схем
+        Список валидируется целиком через закэшированный TypeAdapter
+        с учётом конфигурации схемы (from_attributes должен быть включён в ней).
+        При response_trusted=True схемы собираются через model_construct.
+        Если наследник переопределил _model_to_schema, каждая модель
+        преобразуется через него.
         Args:
             models: Список SQLAlchemy моделей
         Returns:
             Список Pydantic схем ответа
         """
-        return [self._model_to_schema(model) for model in models]
+        if type(self)._model_to_schema is not DPService._model_to_schema:
+            return [self._model_to_schema(model) for model in models]
+        if self.response_trusted:
+            # Метод и список полей берём один раз на весь список, а не на строку
+            construct = self.response_schema.model_construct
+            fields = self._response_fields
+            return [
+                construct(**{field: getattr(model, field) for field in fields})
+                for model in models
+            ]
+        return self._response_list_adapter.validate_python(models)
 
     # ==================== ВАЛИДАЦИОННЫЕ ХУКИ ====================
     async def validate_create(self, create_data: CreateSchemaType) -> None:
@@ -527,6 +593,72 @@ class DPService[
         models = await query_builder.find_all()
         return self._models_to_schemas(models)
 
+    async def get_all_response(
+        self, filter_data: FilterSchemaType | None = None
+    ) -> list[ResponseSchemaType]:
+        """
+        Получить сущности, выбирая из БД только колонки схемы ответа
+        Применяет те же фильтры, сортировку, limit и offset, что и get_all, но
+        ORM объекты не создаются: схемы собираются прямо из строк результата.
+        Все поля схемы ответа должны быть колонками модели.
+        При response_trusted=True схемы собираются через model_construct.
+        Args:
+            filter_data: Схема фильтра (DPFilters) или None для всех записей
+        Returns:
+            Список схем ответа
+        Raises:
+            ValueError: Если поле схемы ответа отсутствует в модели
+        """
+        columns = [self._get_model_column(field) for field in self._response_fields]
+        query_builder = self.repository.query()
+        if filter_data is not None:
+            query_builder = self._apply_base_filters(query_builder, filter_data)
+        rows = await query_builder.find_mappings(columns)
+        if self.response_trusted:
+            construct = self.response_schema.model_construct
+            return [construct(**row) for row in rows]
+        return self._response_list_adapter.validate_python(rows)
+
+    async def get_all_fields(
+        self,
+        filter_data: FilterSchemaType | None,
+        *columns: InstrumentedAttribute[Any],
+    ) -> list[RowMapping]:
+        """
+        Получить только указанные колонки сущностей
+        Применяет те же фильтры, сортировку, limit и offset, что и get_all,
+        но выбирает из БД только переданные колонки, без ORM объектов и схем.
+        Args:
+            filter_data: Схема фильтра (DPFilters) или None для всех записей
+            *columns: Колонки модели для выборки
+        Returns:
+            Список строк в виде RowMapping {имя_колонки: значение}
+        Raises:
+            ValueError: Если колонки не переданы
+        """
+        query_builder = self.repository.query()
+        if filter_data is not None:
+            query_builder = self._apply_base_filters(query_builder, filter_data)
+        return await query_builder.find_mappings(columns)
+
+    async def stream_all(
+        self, filter_data: FilterSchemaType | None = None, chunk_size: int = 1000
+    ) -> AsyncIterator[list[ResponseSchemaType]]:
+        """
+        Получить сущности частями, не загружая всю выборку в память
+        Применяет те же фильтры, сортировку, limit и offset, что и get_all.
+        Args:
+            filter_data: Схема фильтра (DPFilters) или None для всех записей
+            chunk_size: Количество записей в одной части
+        Yields:
+            Списки схем ответа длиной не больше chunk_size
+        """
+        query_builder = self.repository.query()
+        if filter_data is not None:
+            query_builder = self._apply_base_filters(query_builder, filter_data)
+        async for models in query_builder.stream(chunk_size):
+            yield self._models_to_schemas(models)
+
     async def get_first(
         self, filter_data: FilterSchemaType
     ) -> ResponseSchemaType | None:
@@ -559,13 +691,19 @@ class DPService[
     async def exists(self, filter_data: FilterSchemaType) -> bool:
         """
         Проверить существование хотя бы одной сущности с фильтрацией
+        Выполняет SELECT EXISTS, если count не переопределён в наследнике,
+        иначе опирается на count.
         Args:
             filter_data: Схема фильтра
         Returns:
             True если хотя бы одна запись найдена
         """
-        count = await self.count(filter_data)
-        return count > 0
+        if type(self).count is not DPService.count:
+            return await self.count(filter_data) > 0
+        query_builder = self._apply_filter_to_query(
+            self.repository.query(), filter_data
+        )
+        return await query_builder.exists()
 
     async def exists_by_id(self, entity_id: KeyType) -> bool:
         """
@@ -580,6 +718,7 @@ class DPService[
     async def create(self, create_data: CreateSchemaType) -> ResponseSchemaType:
         """
         Создать новую сущность
+        Выполняет только flush, commit остаётся за вызывающим кодом.
         Args:
             create_data: Схема создания с данными
         Returns:
@@ -597,6 +736,8 @@ class DPService[
     ) -> list[ResponseSchemaType]:
         """
         Создать несколько сущностей одновременно (bulk insert)
+        Выполняет только flush: все INSERT уходят в БД, но транзакция не
+        фиксируется. Вызывающий код делает один commit после всех операций.
         Args:
             create_data_list: Список схем создания
         Returns:
@@ -647,14 +788,16 @@ class DPService[
         self,
         entity_id: KeyType,
         update_data: UpdateSchemaType,
-    ) -> None:
+    ) -> ResponseSchemaType | None:
         """
         Обновить сущность по ID
+        Обновлённая строка возвращается тем же UPDATE ... RETURNING,
+        без отдельного запроса get_by_id.
         Args:
             entity_id: Первичный ключ
             update_data: Схема обновления с новыми данными
         Returns:
-            None
+            Схема ответа с обновлённой сущностью или None если она не найдена
         """
         update_data = await self.transform_update_schema(update_data)
         update_dict = self._make_update_dict(update_data)
@@ -664,21 +807,26 @@ class DPService[
             )
 
         await self.validate_update(update_data)
-        await self.repository.update_by_id(entity_id, update_dict)
+        model = await self.repository.update_by_id_returning(entity_id, update_dict)
         await self.session.flush()
+        if model is None:
+            return None
+        return self._model_to_schema(model)
 
     async def update_by_ids(
         self,
         entity_ids: list[KeyType],
         update_data: UpdateSchemaType,
-    ) -> None:
+    ) -> list[ResponseSchemaType]:
         """
         Обновить несколько сущностей по списку ID
+        Обновлённые строки возвращаются тем же UPDATE ... RETURNING,
+        без отдельного запроса get_by_ids.
         Args:
             entity_ids: Список первичных ключей
             update_data: Схема обновления (одинаковая для всех)
         Returns:
-            None
+            Список схем ответа с обновлёнными сущностями
         """
         if not entity_ids:
             raise ValueError("DPService.update_by_ids: Список ID не может быть пустым")
@@ -691,8 +839,9 @@ class DPService[
             )
 
         await self.validate_update(update_data)
-        await self.repository.update_by_ids(entity_ids, update_dict)
+        models = await self.repository.update_by_ids_returning(entity_ids, update_dict)
         await self.session.flush()
+        return self._models_to_schemas(models)
 
     async def delete(self, filter_data: FilterSchemaType) -> None:
         """
@@ -707,39 +856,49 @@ class DPService[
         qb = self._apply_filter_to_query(qb, filter_data)
         await self.repository.delete_by_query_builder(qb)
 
-    async def delete_by_id(self, entity_id: KeyType) -> None:
+    async def delete_by_id(self, entity_id: KeyType) -> bool:
         """
         Удалить сущность по ID
         Args:
             entity_id: Первичный ключ
         Returns:
-            None
+            True если сущность была удалена, False если она не найдена
         """
-        await self.repository.delete_by_id(entity_id)
+        return await self.repository.delete_by_id(entity_id)
 
-    async def delete_by_ids(self, entity_ids: list[KeyType]) -> None:
+    async def delete_by_ids(self, entity_ids: list[KeyType]) -> int:
         """
         Удалить несколько сущностей по списку ID
         Args:
             entity_ids: Список первичных ключей
         Returns:
-            None
+            Количество удалённых записей
         """
         if not entity_ids:
             raise ValueError("DPService.delete_by_ids: Список ID не может быть пустым")
 
-        await self.repository.delete_by_ids(entity_ids)
+        return await self.repository.delete_by_ids(entity_ids)
 
     async def paginate(
-        self, page: int, per_page: int, filter_data: FilterSchemaType
+        self,
+        page: int,
+        per_page: int,
+        filter_data: FilterSchemaType,
+        total_count: int | None = None,
     ) -> tuple[list[ResponseSchemaType], int]:
         """
         Пагинация с фильтрацией и сортировкой
         Автоматически использует DPFilters для фильтрации и сортировки.
+        Страница выбирается через get_all, общее количество — через count.
+        Если ни get_all, ни count не переопределены в наследнике, количество
+        считается в том же запросе, что и страница (COUNT(*) OVER ()), а
+        отдельный COUNT выполняется только для пустой страницы.
         Args:
             page: Номер страницы (начиная с 1)
             per_page: Количество элементов на странице
             filter_data: Схема фильтра (DPFilters)
+            total_count: Уже известное общее количество записей (например, с первой
+                страницы). Если передано, запрос COUNT не выполняется
         Returns:
             Кортеж (список_данных, общее_количество)
         Raises:
@@ -752,11 +911,25 @@ class DPService[
                 "DPService.paginate: Количество на странице должно быть >= 1"
             )
 
-        total_count = await self.count(filter_data)
-
         paginated_filter = self._clone_and_modify_filter(
             filter_data, limit=per_page, offset=(page - 1) * per_page
         )
 
-        items = await self.get_all(paginated_filter)
-        return items, total_count
+        if total_count is not None:
+            return await self.get_all(paginated_filter), total_count
+
+        if (
+            type(self).get_all is not DPService.get_all
+            or type(self).count is not DPService.count
+        ):
+            items = await self.get_all(paginated_filter)
+            return items, await self.count(filter_data)
+
+        query_builder = self._apply_base_filters(
+            self.repository.query(), paginated_filter
+        )
+        models, total = await query_builder.find_all_with_total()
+        if total is None:
+            # Пустая страница: окно не вернуло строк, считаем отдельно
+            total = await self.count(filter_data)
+        return self._models_to_schemas(models), total
@@ -1,6 +1,7 @@
 """Применение фильтров к query builder для построения SQL запросов"""
 
 import datetime
+from collections.abc import Sequence
 from decimal import Decimal
 from enum import Enum
 from typing import Any, Protocol, cast
@@ -56,9 +57,9 @@ class SupportsFiltering(Protocol):
 
     def where_ne(self, column: Any, value: Any) -> Any: ...
 
-    def where_in(self, column: Any, values: list[Any]) -> Any: ...
+    def where_in(self, column: Any, values: Sequence[Any]) -> Any: ...
 
-    def where_not_in(self, column: Any, values: list[Any]) -> Any: ...
+    def where_not_in(self, column: Any, values: Sequence[Any]) -> Any: ...
 
     def where_is_null(self, column: Any) -> Any: ...
 
@@ -169,6 +170,8 @@ class FilterApplier:
 
         Применяет операции: gt, gte, lt, lte, between.
         Также обрабатывает алиасы from_ и to для временных фильтров.
+        Диапазон between из конструктора раскладывается в gte/lte ещё при создании
+        фильтра; здесь применяется только between, присвоенный после создания.
 
         Args:
             query_builder: Query builder для применения фильтров
@@ -381,11 +384,11 @@ class FilterApplier:
         if not sa_enum:
             return filt
 
-        def map_list(lst: list[Any] | None) -> list[Any] | None:
+        def map_list(lst: Sequence[Any] | None) -> tuple[Any, ...] | None:
             return (
                 None
                 if lst is None
-                else [cls._coerce_single_enum_value(sa_enum, v) for v in lst]
+                else tuple(cls._coerce_single_enum_value(sa_enum, v) for v in lst)
             )
 
         if getattr(filt, "eq", None) is not None:
@@ -449,9 +452,9 @@ class FilterApplier:
         """
         from sqlalchemy import and_, or_
 
-        words = filter_data.words
+        patterns = filter_data.like_patterns
         # Если text пустой — фильтр не применяется (не проверяем columns)
-        if not words:
+        if not patterns:
             return query_builder
 
         search_columns = filter_data.columns
@@ -465,17 +468,21 @@ class FilterApplier:
                 )
             search_columns = [getattr(model, field_name)]
 
-        # Для каждого слова создаем условие: слово должно быть найдено хотя бы в одной колонке (OR)
-        word_conditions = []
-        for word in words:
-            column_conditions = [col.ilike(f"%{word}%") for col in search_columns]
-            word_conditions.append(or_(*column_conditions))
+        escape = filter_data.like_escape
 
-        # Все слова должны быть найдены (AND между словами)
-        if word_conditions:
-            query_builder = query_builder.where(and_(*word_conditions))
+        def build(columns: Sequence[Any]) -> Any:
+            # Для каждого слова создаем условие: слово должно быть найдено хотя бы в одной колонке (OR)
+            word_conditions = [
+                or_(*[col.ilike(pattern, escape=escape) for col in columns])
+                for pattern in patterns
+            ]
+            # Все слова должны быть найдены (AND между словами)
+            return and_(*word_conditions)
 
-        return query_builder
+        # Повторное применение фильтра к тем же колонкам (count и get_all)
+        # берет условие, построенное в первый раз
+        condition = filter_data.condition_for(search_columns, build)
+        return query_builder.where(condition)
 
     def apply_filters_from_schema(
         self,
@@ -547,13 +554,11 @@ class FilterApplier:
                 query_builder = self.apply_uuid_filter(
                     query_builder, column, field_value
                 )
-            elif isinstance(field_value, (IntFilter, FloatFilter, DecimalFilter)):
+            elif isinstance(field_value, BaseNumberFilter):
                 query_builder = self.apply_base_number_filter(
                     query_builder, column, field_value
                 )
-            elif isinstance(
-                field_value, (DateTimeFilter, DateFilter, TimeFilter, TimestampFilter)
-            ):
+            elif isinstance(field_value, BaseDateTimeFilter):
                 query_builder = self.apply_base_datetime_filter(
                     query_builder, column, field_value
                 )
@@ -600,18 +605,12 @@ class FilterApplier:
                 query_builder, column, cast(BooleanFilter, filter_instance)
             )
         # Числовые фильтры (используем базовый метод для всех)
-        elif filter_type in (IntFilter, FloatFilter, DecimalFilter, BaseNumberFilter):
+        elif issubclass(filter_type, BaseNumberFilter):
             return self.apply_base_number_filter(
                 query_builder, column, cast(BaseNumberFilter[Any], filter_instance)
             )
         # Фильтры даты/времени (используем базовый метод для всех)
-        elif filter_type in (
-            DateTimeFilter,
-            DateFilter,
-            TimeFilter,
-            TimestampFilter,
-            BaseDateTimeFilter,
-        ):
+        elif issubclass(filter_type, BaseDateTimeFilter):
             return self.apply_base_datetime_filter(
                 query_builder, column, cast(BaseDateTimeFilter[Any], filter_instance)
             )
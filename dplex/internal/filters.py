@@ -1,5 +1,6 @@
 """Типизированные операторы фильтрации для всех типов данных"""
 
+from collections.abc import Callable, Sequence
 from datetime import date, datetime, time
 from decimal import Decimal
 from enum import Enum
@@ -10,6 +11,26 @@ T = TypeVar("T")
 EnumT = TypeVar("EnumT", bound=Enum)
 
 
+def _merge_between(gte: Any, lte: Any, between: tuple[Any, Any]) -> tuple[Any, Any]:
+    """
+    Объединить диапазон between с границами gte/lte
+
+    Args:
+        gte: Нижняя граница или None
+        lte: Верхняя граница или None
+        between: Кортеж (нижняя, верхняя) границ диапазона
+
+    Returns:
+        Кортеж (gte, lte): большая из нижних и меньшая из верхних границ
+    """
+    lower, upper = between
+    if gte is None or lower > gte:
+        gte = lower
+    if lte is None or upper < lte:
+        lte = upper
+    return gte, lte
+
+
 class BaseNumberFilter[T]:
     """
     Базовый фильтр для числовых полей
@@ -22,6 +43,20 @@ class BaseNumberFilter[T]:
         T: Тип числовых данных (int, float, Decimal и т.д.)
     """
 
+    __slots__ = (
+        "eq",
+        "ne",
+        "gt",
+        "gte",
+        "lt",
+        "lte",
+        "between",
+        "in_",
+        "not_in",
+        "is_null",
+        "is_not_null",
+    )
+
     def __init__(
         self,
         eq: T | None = None,
@@ -31,8 +66,8 @@ class BaseNumberFilter[T]:
         lt: T | None = None,
         lte: T | None = None,
         between: tuple[T, T] | None = None,
-        in_: list[T] | None = None,
-        not_in: list[T] | None = None,
+        in_: list[T] | tuple[T, ...] | None = None,
+        not_in: list[T] | tuple[T, ...] | None = None,
         is_null: bool | None = None,
         is_not_null: bool | None = None,
     ) -> None:
@@ -46,7 +81,8 @@ class BaseNumberFilter[T]:
             gte: Больше или равно (greater than or equal)
             lt: Меньше чем (less than)
             lte: Меньше или равно (less than or equal)
-            between: В диапазоне (between). Кортеж из двух границ (включительно)
+            between: В диапазоне (between). Кортеж из двух границ (включительно).
+                Объединяется с gte/lte при инициализации: остаётся более узкий диапазон
             in_: Входит в список (in). Список допустимых значений
             not_in: Не входит в список (not in). Список исключаемых значений
             is_null: Является NULL. Если True, проверяет что значение равно NULL
@@ -55,6 +91,9 @@ class BaseNumberFilter[T]:
         Returns:
             None
         """
+        if between is not None:
+            gte, lte = _merge_between(gte, lte, between)
+            between = None
         self.eq = eq
         """Равно (equal). Ищет точное совпадение значения. Пример: age == 25"""
         self.ne = ne
@@ -71,13 +110,15 @@ class BaseNumberFilter[T]:
         """
         В диапазоне (between). Проверяет, находится ли значение между двумя границами (включительно).
         Пример: price BETWEEN 10.0 AND 100.0 → between=(10.0, 100.0)
+        Переданный в конструктор диапазон объединяется с gte/lte, и атрибут равен None.
+        Значение, присвоенное после создания, применяется как BETWEEN.
         """
-        self.in_ = in_
+        self.in_ = tuple(in_) if in_ is not None else None
         """
         Входит в список (in). Проверяет, содержится ли значение в заданном списке.
         Пример: rating IN (1, 2, 3, 4, 5) → in_=[1, 2, 3, 4, 5]
         """
-        self.not_in = not_in
+        self.not_in = tuple(not_in) if not_in is not None else None
         """
         Не входит в список (not in). Исключает значения из заданного списка.
         Пример: id NOT IN (5, 10, 15) → not_in=[5, 10, 15]
@@ -125,7 +166,7 @@ class IntFilter(BaseNumberFilter[int]):
         - Идентификаторы (не UUID)
     """
 
-    pass
+    __slots__ = ()
 
 
 class FloatFilter(BaseNumberFilter[float]):
@@ -164,7 +205,7 @@ class FloatFilter(BaseNumberFilter[float]):
         вместо FloatFilter для избежания ошибок округления.
     """
 
-    pass
+    __slots__ = ()
 
 
 class DecimalFilter(BaseNumberFilter[Decimal]):
@@ -214,7 +255,7 @@ class DecimalFilter(BaseNumberFilter[Decimal]):
         - Предсказуемые результаты вычислений
     """
 
-    pass
+    __slots__ = ()
 
 
 # Для обратной совместимости и удобства
@@ -235,6 +276,21 @@ class StringFilter:
         >>> status_filter = StringFilter(not_in=["deleted", "banned"])
     """
 
+    __slots__ = (
+        "eq",
+        "ne",
+        "like",
+        "ilike",
+        "contains",
+        "icontains",
+        "starts_with",
+        "ends_with",
+        "in_",
+        "not_in",
+        "is_null",
+        "is_not_null",
+    )
+
     def __init__(
         self,
         eq: str | None = None,
@@ -245,8 +301,8 @@ class StringFilter:
         icontains: str | None = None,
         starts_with: str | None = None,
         ends_with: str | None = None,
-        in_: list[str] | None = None,
-        not_in: list[str] | None = None,
+        in_: list[str] | tuple[str, ...] | None = None,
+        not_in: list[str] | tuple[str, ...] | None = None,
         is_null: bool | None = None,
         is_not_null: bool | None = None,
     ) -> None:
@@ -316,12 +372,12 @@ class StringFilter:
         Эквивалентно LIKE '%value'.
         Пример: filename заканчивается на ".pdf" → ends_with=".pdf"
         """
-        self.in_ = in_
+        self.in_ = tuple(in_) if in_ is not None else None
         """
         Входит в список (in). Проверяет, содержится ли строка в заданном списке.
         Пример: status IN ('active', 'pending') → in_=["active", "pending"]
         """
-        self.not_in = not_in
+        self.not_in = tuple(not_in) if not_in is not None else None
         """
         Не входит в список (not in). Исключает строки из заданного списка.
         Пример: role NOT IN ('admin', 'moderator') → not_in=["admin", "moderator"]
@@ -356,6 +412,8 @@ class BooleanFilter:
         >>> undefined_filter = BooleanFilter(is_null=True)
     """
 
+    __slots__ = ("eq", "ne", "is_null", "is_not_null")
+
     def __init__(
         self,
         eq: bool | None = None,
@@ -409,6 +467,22 @@ class BaseDateTimeFilter[T]:
         T: Тип временных данных (datetime, date, time и т.д.)
     """
 
+    __slots__ = (
+        "eq",
+        "ne",
+        "gt",
+        "gte",
+        "lt",
+        "lte",
+        "between",
+        "from_",
+        "to",
+        "in_",
+        "not_in",
+        "is_null",
+        "is_not_null",
+    )
+
     def __init__(
         self,
         eq: T | None = None,
@@ -420,8 +494,8 @@ class BaseDateTimeFilter[T]:
         between: tuple[T, T] | None = None,
         from_: T | None = None,
         to: T | None = None,
-        in_: list[T] | None = None,
-        not_in: list[T] | None = None,
+        in_: list[T] | tuple[T, ...] | None = None,
+        not_in: list[T] | tuple[T, ...] | None = None,
         is_null: bool | None = None,
         is_not_null: bool | None = None,
     ) -> None:
@@ -435,7 +509,8 @@ class BaseDateTimeFilter[T]:
             gte: Больше или равно (greater than or equal). Начиная с указанной даты/времени
             lt: Меньше чем (less than). Раньше указанной даты/времени
             lte: Меньше или равно (less than or equal). До указанной даты/времени включительно
-            between: В диапазоне (between). Кортеж из двух дат/времен (включительно)
+            between: В диапазоне (between). Кортеж из двух дат/времен (включительно).
+                Объединяется с gte/lte при инициализации: остаётся более узкий диапазон
             from_: От даты (from). Удобный алиас для gte (больше или равно)
             to: До даты (to). Удобный алиас для lte (меньше или равно)
             in_: Входит в список (in). Список допустимых дат/времен
@@ -446,6 +521,9 @@ class BaseDateTimeFilter[T]:
         Returns:
             None
         """
+        if between is not None:
+            gte, lte = _merge_between(gte, lte, between)
+            between = None
         self.eq = eq
         """
         Равно (equal). Точное совпадение даты/времени.
@@ -481,6 +559,8 @@ class BaseDateTimeFilter[T]:
         В диапазоне (between). Между двумя датами/временем включительно.
         Пример: created_at BETWEEN '2024-01-01' AND '2024-12-31'
         → between=(datetime(2024, 1, 1), datetime(2024, 12, 31))
+        Переданный в конструктор диапазон объединяется с gte/lte, и атрибут равен None.
+        Значение, присвоенное после создания, применяется как BETWEEN.
         """
         self.from_ = from_
         """
@@ -494,13 +574,13 @@ class BaseDateTimeFilter[T]:
         Более читаемый способ указать конец периода.
         Пример: to=datetime(2024, 12, 31) эквивалентно lte=datetime(2024, 12, 31)
         """
-        self.in_ = in_
+        self.in_ = tuple(in_) if in_ is not None else None
         """
         Входит в список (in). Проверяет совпадение с одним из значений в списке.
         Пример: event_date IN ('2024-01-01', '2024-06-01')
         → in_=[datetime(2024, 1, 1), datetime(2024, 6, 1)]
         """
-        self.not_in = not_in
+        self.not_in = tuple(not_in) if not_in is not None else None
         """
         Не входит в список (not in). Исключает определенные даты/время.
         Пример: birthday NOT IN ('2024-01-01', '2024-12-25')
@@ -551,7 +631,7 @@ class DateFilter(BaseDateTimeFilter[date]):
         - Подходит для полей типа "день рождения", "дата публикации" и т.д.
     """
 
-    pass
+    __slots__ = ()
 
 
 class DateTimeFilter(BaseDateTimeFilter[datetime]):
@@ -593,7 +673,7 @@ class DateTimeFilter(BaseDateTimeFilter[datetime]):
         - Может фильтровать по времени суток, а не только по дням
     """
 
-    pass
+    __slots__ = ()
 
 
 class TimestampFilter(BaseDateTimeFilter[int]):
@@ -635,7 +715,7 @@ class TimestampFilter(BaseDateTimeFilter[int]):
         - Легко работать с интервалами (просто +/- секунды)
     """
 
-    pass
+    __slots__ = ()
 
 
 class TimeFilter(BaseDateTimeFilter[time]):
@@ -671,7 +751,7 @@ class TimeFilter(BaseDateTimeFilter[time]):
         - Часы работы магазинов/сервисов
     """
 
-    pass
+    __slots__ = ()
 
 
 class EnumFilter[EnumT: Enum]:
@@ -722,12 +802,14 @@ class EnumFilter[EnumT: Enum]:
         - Явная семантика кода
     """
 
+    __slots__ = ("eq", "ne", "in_", "not_in", "is_null", "is_not_null")
+
     def __init__(
         self,
         eq: EnumT | None = None,
         ne: EnumT | None = None,
-        in_: list[EnumT] | None = None,
-        not_in: list[EnumT] | None = None,
+        in_: list[EnumT] | tuple[EnumT, ...] | None = None,
+        not_in: list[EnumT] | tuple[EnumT, ...] | None = None,
         is_null: bool | None = None,
         is_not_null: bool | None = None,
     ) -> None:
@@ -755,12 +837,12 @@ class EnumFilter[EnumT: Enum]:
         Не равно (not equal). Исключает конкретное значение enum.
         Пример: status != OrderStatus.CANCELLED → ne=OrderStatus.CANCELLED
         """
-        self.in_ = in_
+        self.in_ = tuple(in_) if in_ is not None else None
         """
         Входит в список (in). Проверяет, является ли значение одним из указанных enum.
         Пример: status IN (PENDING, PROCESSING) → in_=[OrderStatus.PENDING, OrderStatus.PROCESSING]
         """
-        self.not_in = not_in
+        self.not_in = tuple(not_in) if not_in is not None else None
         """
         Не входит в список (not in). Исключает указанные значения enum.
         Пример: role NOT IN (GUEST, BANNED) → not_in=[UserRole.GUEST, UserRole.BANNED]
@@ -813,12 +895,14 @@ class UUIDFilter:
         - Уникальные идентификаторы документов
     """
 
+    __slots__ = ("eq", "ne", "in_", "not_in", "is_null", "is_not_null")
+
     def __init__(
         self,
         eq: Any | None = None,  # UUID type
         ne: Any | None = None,
-        in_: list[Any] | None = None,
-        not_in: list[Any] | None = None,
+        in_: list[Any] | tuple[Any, ...] | None = None,
+        not_in: list[Any] | tuple[Any, ...] | None = None,
         is_null: bool | None = None,
         is_not_null: bool | None = None,
     ) -> None:
@@ -846,12 +930,12 @@ class UUIDFilter:
         Не равно (not equal). Исключает конкретный UUID.
         Пример: id != UUID(...) → ne=UUID("123e4567-...")
         """
-        self.in_ = in_
+        self.in_ = tuple(in_) if in_ is not None else None
         """
         Входит в список (in). Проверяет вхождение UUID в список.
         Пример: id IN (...) → in_=[UUID("123..."), UUID("456...")]
         """
-        self.not_in = not_in
+        self.not_in = tuple(not_in) if not_in is not None else None
         """
         Не входит в список (not in). Исключает указанные UUID.
         Пример: id NOT IN (...) → not_in=[UUID("123..."), UUID("456...")]
@@ -899,6 +983,15 @@ class WordsFilter:
         >>> filters = UserFilters(name=WordsFilter(None))  # фильтр не будет применен
     """
 
+    __slots__ = ("text", "words", "like_patterns", "columns", "_condition_cache")
+
+    like_escape = "\\"
+    """
+    Escape-символ для like_patterns: % и _ в словах ищутся буквально
+    """
+
+    _like_escape_table = str.maketrans({"\\": "\\\\", "%": "\\%", "_": "\\_"})
+
     def __init__(
         self, text: str | None = None, columns: list[Any] | None = None
     ) -> None:
@@ -921,15 +1014,55 @@ class WordsFilter:
         """
         self.words = self._split_into_words(self.text)
         """
-        Список слов, полученных из текста (автоматически разбивается)
+        Слова, полученные из текста (автоматически разбивается)
+        """
+        self.like_patterns = tuple(
+            f"%{word.translate(self._like_escape_table)}%" for word in self.words
+        )
+        """
+        Шаблоны ILIKE для поиска подстроки, по одному на слово.
+        Спецсимволы LIKE экранируются через like_escape.
+        Строятся один раз при создании фильтра, а не при каждом применении
         """
         self.columns = columns
         """
         Список колонок модели для поиска
         """
+        self._condition_cache: tuple[tuple[Any, ...], Any] | None = None
+        """
+        Последнее построенное условие и колонки, для которых оно построено
+        (см. condition_for)
+        """
+
+    def condition_for(
+        self, columns: Sequence[Any], build: Callable[[Sequence[Any]], Any]
+    ) -> Any:
+        """
+        Получить условие поиска для колонок, построив его не больше одного раза
+
+        Повторное применение того же фильтра к тем же колонкам (например,
+        count и get_all) возвращает ранее построенное выражение.
+
+        Args:
+            columns: Колонки модели для поиска
+            build: Функция, строящая условие по колонкам
+
+        Returns:
+            SQLAlchemy условие поиска
+        """
+        cached = self._condition_cache
+        if (
+            cached is not None
+            and len(cached[0]) == len(columns)
+            and all(a is b for a, b in zip(cached[0], columns, strict=True))
+        ):
+            return cached[1]
+        condition = build(columns)
+        self._condition_cache = (tuple(columns), condition)
+        return condition
 
     @staticmethod
-    def _split_into_words(text: str) -> list[str]:
+    def _split_into_words(text: str) -> tuple[str, ...]:
         """
         Разбить строку на слова
 
@@ -939,11 +1072,10 @@ class WordsFilter:
             text: Строка для разбивки
 
         Returns:
-            Список слов
+            Кортеж слов
         """
-        if not text:
-            return []
-        return [word.strip() for word in text.split() if word.strip()]
+        # str.split() без аргументов уже отбрасывает пустые строки и пробелы
+        return tuple(text.split())
 
     def __repr__(self) -> str:
         """Строковое представление для отладки"""
@@ -1,9 +1,11 @@
 """Query Builder для построения типизированных SQL запросов с поддержкой фильтрации и сортировки"""
 
+from collections.abc import AsyncIterator, Sequence
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import ColumnElement, asc, desc, nullsfirst, nullslast
+from sqlalchemy import ColumnElement, RowMapping, asc, desc, nullsfirst, nullslast
 from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.orm.interfaces import ORMOption
 
 if TYPE_CHECKING:
     from dplex.dp_repo import DPRepo
@@ -19,7 +21,7 @@ class QueryBuilder[ModelType]:
     - Фильтрации (WHERE условия)
     - Сортировки (ORDER BY с управлением NULL)
     - Пагинации (LIMIT/OFFSET)
-    - Выполнения запросов (find_all, find_one, count, exists)
+    - Выполнения запросов (find_all, find_one, find_mappings, stream, count, exists)
 
     Type Parameters:
         ModelType: Тип SQLAlchemy модели
@@ -31,6 +33,7 @@ class QueryBuilder[ModelType]:
         limit_value: Значение LIMIT
         offset_value: Значение OFFSET
         order_by_clauses: Список условий сортировки
+        load_options: Опции загрузки (selectinload, joinedload, load_only и т.п.)
     """
 
     def __init__(self, repo: "DPRepo[ModelType, Any]", model: type[ModelType]) -> None:
@@ -50,6 +53,7 @@ class QueryBuilder[ModelType]:
         self.limit_value: int | None = None
         self.offset_value: int | None = None
         self.order_by_clauses: list[Any] = []
+        self.load_options: list[ORMOption] = []
 
     def where(self, condition: ColumnElement[bool]) -> "QueryBuilder[ModelType]":
         """
@@ -99,14 +103,14 @@ class QueryBuilder[ModelType]:
         return self.where(condition)
 
     def where_in(
-        self, column: InstrumentedAttribute[Any], values: list[Any]
+        self, column: InstrumentedAttribute[Any], values: Sequence[Any]
     ) -> "QueryBuilder[ModelType]":
         """
         WHERE column IN (values)
 
         Args:
             column: Колонка модели
-            values: Список допустимых значений
+            values: Список или кортеж допустимых значений
 
         Returns:
             Self для цепочки вызовов
@@ -122,14 +126,14 @@ class QueryBuilder[ModelType]:
         return self.where(condition)
 
     def where_not_in(
-        self, column: InstrumentedAttribute[Any], values: list[Any]
+        self, column: InstrumentedAttribute[Any], values: Sequence[Any]
     ) -> "QueryBuilder[ModelType]":
         """
         WHERE column NOT IN (values)
 
         Args:
             column: Колонка модели
-            values: Список исключаемых значений
+            values: Список или кортеж исключаемых значений
 
         Returns:
             Self для цепочки вызовов
@@ -286,6 +290,25 @@ class QueryBuilder[ModelType]:
         condition: ColumnElement[bool] = column <= value
         return self.where(condition)
 
+    def options(self, *options: ORMOption) -> "QueryBuilder[ModelType]":
+        """
+        Добавить опции загрузки к SELECT запросу
+
+        Например selectinload(Model.relation) загружает связи всех строк
+        одним дополнительным запросом вместо отдельного SELECT на каждую строку.
+        joinedload по коллекции размножает строки JOIN: find_all схлопывает
+        их через unique(), а find_all_with_total считает итог отдельным COUNT.
+        Для stream() используйте selectinload.
+
+        Args:
+            *options: Опции загрузки SQLAlchemy ORM
+
+        Returns:
+            Self для цепочки вызовов
+        """
+        self.load_options.extend(options)
+        return self
+
     def limit(self, limit: int) -> "QueryBuilder[ModelType]":
         """
         LIMIT - ограничить количество записей
@@ -481,6 +504,43 @@ class QueryBuilder[ModelType]:
         """
         return await self.repo.execute_typed_query(self)
 
+    async def find_mappings(
+        self, columns: Sequence[InstrumentedAttribute[Any]]
+    ) -> list[RowMapping]:
+        """
+        Выполнить запрос и вернуть только указанные колонки
+
+        Args:
+            columns: Колонки модели для выборки
+
+        Returns:
+            Список строк в виде RowMapping {имя_колонки: значение}
+        """
+        return await self.repo.execute_typed_mappings(self, columns)
+
+    async def find_all_with_total(self) -> tuple[list[ModelType], int | None]:
+        """
+        Выполнить запрос и вернуть результаты вместе с общим количеством
+
+        Общее количество считается без учёта LIMIT/OFFSET в том же запросе.
+
+        Returns:
+            Кортеж (список моделей, общее количество или None для пустого результата)
+        """
+        return await self.repo.execute_typed_query_with_total(self)
+
+    def stream(self, chunk_size: int = 1000) -> AsyncIterator[list[ModelType]]:
+        """
+        Выполнить запрос и отдавать результаты частями
+
+        Args:
+            chunk_size: Количество моделей в одной части
+
+        Returns:
+            Асинхронный итератор по спискам моделей
+        """
+        return self.repo.stream_typed_query(self, chunk_size)
+
     async def find_one(self) -> ModelType | None:
         """
         Выполнить запрос и вернуть первый результат или None
@@ -526,10 +586,10 @@ class QueryBuilder[ModelType]:
         """
         Проверить существование записей соответствующих запросу
 
-        Эквивалентно count() > 0, но более выразительно.
+        Эквивалентно count() > 0, но выполняется через EXISTS
+        и не считает все подходящие строки.
 
         Returns:
             True если хотя бы одна запись найдена, иначе False
         """
-        count = await self.count()
-        return count > 0
+        return await self.repo.execute_typed_exists(self)
@@ -7,7 +7,6 @@ from typing import Any, TypeVar
 from pydantic import BaseModel
 from sqlalchemy.orm import DeclarativeBase
 
-# Используем TYPE_CHECKING для избежания циклических импортов
 from dplex.internal.filters import (
     BaseDateTimeFilter,
     BaseNumberFilter,
@@ -90,7 +89,7 @@ TypeVar для типа поля сортировки
 Ограничен StrEnum для обеспечения типобезопасности при сортировке.
 Используется в Sort[SortByType] и DPFilters[SortByType].
 """
-# Определяем FilterType только для type checkers
+
 FilterType = (
     StringFilter
     | IntFilter
@@ -111,7 +110,7 @@ FilterType = (
 Union тип всех доступных фильтров
 
 Используется для типизации методов, принимающих любой тип фильтра.
-Включает все специализированные классы фильтров из dplex.services.filters.
+Включает все специализированные классы фильтров из dplex.internal.filters.
 
 Типы фильтров:
     - StringFilter: Фильтрация строковых полей
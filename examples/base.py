@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+import os
+import time
 import uuid
 from datetime import datetime
 from enum import StrEnum
+from typing import ClassVar, Final
 
 from pydantic import BaseModel, ConfigDict
-from sqlalchemy import String
+from sqlalchemy import Index, String
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
@@ -16,18 +19,37 @@ from dplex.internal.sort import NullsPlacement, Order, Sort
 
 
 # ===================== 1) Модель =====================
+def uuid7() -> uuid.UUID:
+    """
+    UUID версии 7 (RFC 9562): 48 бит Unix-времени в мс + случайные биты
+
+    Ключи растут со временем, поэтому вставки идут в конец индекса PK,
+    а не в случайные страницы, как у uuid4.
+    """
+    unix_ms = time.time_ns() // 1_000_000
+    value = (unix_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10))
+    value = value & ~(0xF << 76) | 0x7 << 76  # версия 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # вариант RFC
+    return uuid.UUID(int=value)
+
+
 class Base(DeclarativeBase): ...
 
 
 class User(Base):
     __tablename__ = "users"
 
-    user_id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    user_id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
     name: Mapped[str] = mapped_column(String(200), nullable=False)
     email: Mapped[str | None] = mapped_column(String(255), unique=True)
     created_at: Mapped[datetime] = mapped_column(insert_default=datetime.now)
 
 
+# Индекс в порядке сортировки example_flow (created_at DESC, name ASC):
+# БД отдаёт строки уже отсортированными и останавливается на LIMIT
+Index("ix_users_created_at_desc_name", User.created_at.desc(), User.name)
+
+
 # ===================== 2) Pydantic-схемы =====================
 class UserCreate(BaseModel):
     name: str
@@ -55,6 +77,12 @@ class UserSortField(StrEnum):
     CREATED_AT = "created_at"
 
 
+SORT_NAME_ASC: Final = Sort(by=UserSortField.NAME, order=Order.ASC)
+SORT_CREATED_AT_DESC_NULLS_LAST: Final = Sort(
+    by=UserSortField.CREATED_AT, order=Order.DESC, nulls=NullsPlacement.LAST
+)
+
+
 class UserFilters(DPFilters[UserSortField]):
     """
     Набор фильтров для выборки пользователей.
@@ -78,6 +106,12 @@ class UserFilters(DPFilters[UserSortField]):
                        Поддерживает `eq`, `ne`, `lt`, `lte`, `gt`, `gte`, `between`.
     """
 
+    # Колонки для сортировки заданы явно, без поиска атрибута модели по имени
+    sort_map: ClassVar = {
+        UserSortField.NAME: User.name,
+        UserSortField.CREATED_AT: User.created_at,
+    }
+
     user_id: UUIDFilter | None = None
     name: StringFilter | None = None
     email: StringFilter | None = None
@@ -111,6 +145,12 @@ class UserService(
         super().__init__(repository=repo, session=session, response_schema=UserResponse)
 
 
+# Движок и фабрика сессий создаются один раз при импорте модуля
+# и переиспользуются всеми примерами
+ENGINE = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+ASYNC_SESSION_MAKER = async_sessionmaker(ENGINE, expire_on_commit=False)
+
+
 async def init_database(engine) -> None:
     """Создать все таблицы в БД"""
     async with engine.begin() as conn:
@@ -125,66 +165,68 @@ async def example_flow(session: AsyncSession) -> None:
     service = UserService(repo, session)
 
     # ---- Create: создадим больше пользователей с разными email (в т.ч. @mail.ru)
-    await service.create(UserCreate(name="Иван", email="ivan@example.com"))
-    await service.create(UserCreate(name="Анна", email="anna@example.com"))
-    await service.create(UserCreate(name="Борис", email="boris@mail.ru"))
-    await service.create(UserCreate(name="Вера", email=None))
-    await service.create(UserCreate(name="Григорий", email="grigoriy@mail.ru"))
-    u = await service.create(
-        UserCreate(name="Денис", email="denis@mail.com")
-    )  # возьмём как 'u' для дальнейших операций
+    # Один create_bulk вместо шести create: все INSERT уходят одним flush
+    created = await service.create_bulk(
+        [
+            UserCreate(name="Иван", email="ivan@example.com"),
+            UserCreate(name="Анна", email="anna@example.com"),
+            UserCreate(name="Борис", email="boris@mail.ru"),
+            UserCreate(name="Вера", email=None),
+            UserCreate(name="Григорий", email="grigoriy@mail.ru"),
+            UserCreate(name="Денис", email="denis@mail.com"),
+        ]
+    )
+    u = created[-1]  # возьмём 'Денис' как 'u' для дальнейших операций
     print("✓ Users created")
 
     # ---- Read #0: все записи без параметров (get_all/count без filter_data)
     all_users = await service.get_all()
     total_count = await service.count()
     print(f"\nВсе записи (без фильтров): {total_count} шт.")
-    for it in all_users:
-        print(f"  {it.name:10s} | {it.email or '-':20s}")
+    if all_users:
+        print("\n".join(f"  {it.name:10s} | {it.email or '-':20s}" for it in all_users))
 
     # ---- Read #1: ЯВНАЯ сортировка по ИМЕНИ (ASC), затем по ДАТЕ СОЗДАНИЯ (DESC, nulls last)
     users_by_name_then_created = await service.get_all(
         UserFilters(
             sort=[
-                Sort(by=UserSortField.NAME, order=Order.ASC),  # 1-й ключ: name ASC
-                Sort(
-                    by=UserSortField.CREATED_AT,
-                    order=Order.DESC,
-                    nulls=NullsPlacement.LAST,
-                ),  # 2-й ключ: created_at DESC NULLS LAST
+                SORT_NAME_ASC,  # 1-й ключ: name ASC
+                SORT_CREATED_AT_DESC_NULLS_LAST,  # 2-й ключ: created_at DESC NULLS LAST
             ],
             limit=50,
             offset=0,
         )
     )
     print("\nSorted by NAME ASC, then CREATED_AT DESC (NULLS LAST):")
-    for it in users_by_name_then_created:
-        print(f"  {it.name:10s} | {it.email or '-':20s} | {it.created_at}")
+    if users_by_name_then_created:
+        print(
+            "\n".join(
+                f"  {it.name:10s} | {it.email or '-':20s} | {it.created_at}"
+                for it in users_by_name_then_created
+            )
+        )
 
     # ---- Read #2: Фильтр только @mail.ru + ЯВНАЯ сортировка по ДАТЕ (DESC NULLS LAST), затем по ИМЕНИ (ASC)
     only_mail_ru = await service.get_all(
         UserFilters(
             email=StringFilter(ends_with="@mail.ru"),
-            sort=[
-                Sort(
-                    by=UserSortField.CREATED_AT,
-                    order=Order.DESC,
-                    nulls=NullsPlacement.LAST,
-                ),
-                Sort(by=UserSortField.NAME, order=Order.ASC),
-            ],
+            sort=[SORT_CREATED_AT_DESC_NULLS_LAST, SORT_NAME_ASC],
             limit=50,
             offset=0,
         )
     )
     print("\n@mail.ru ONLY — sorted by CREATED_AT DESC (NULLS LAST), then NAME ASC:")
-    for it in only_mail_ru:
-        print(f"  {it.name:10s} | {it.email or '-':20s} | {it.created_at}")
+    if only_mail_ru:
+        print(
+            "\n".join(
+                f"  {it.name:10s} | {it.email or '-':20s} | {it.created_at}"
+                for it in only_mail_ru
+            )
+        )
 
     # ---- Update: обнулим email у пользователя 'u' (NULL в БД)
-    await service.update_by_id(u.user_id, UserUpdate(email=None))
-
-    u2 = await service.get_by_id(u.user_id)
+    # update_by_id сразу возвращает обновлённую запись (UPDATE ... RETURNING)
+    u2 = await service.update_by_id(u.user_id, UserUpdate(email=None))
 
     print(f"\nUpdated (email -> NULL): {u2.user_id} | {u2.name} | {u2.email}")
 
@@ -208,28 +250,27 @@ async def example_flow(session: AsyncSession) -> None:
     # ---- Контрольная выборка после удаления: снова по имени
     after_delete = await service.get_all(
         UserFilters(
-            sort=[Sort(by=UserSortField.NAME, order=Order.ASC)],
+            sort=[SORT_NAME_ASC],
             limit=50,
             offset=0,
         )
     )
     print("\nAfter delete — sorted by NAME ASC:")
-    for it in after_delete:
-        print(f"  {it.name:10s} | {it.email or '-':20s} | {it.created_at}")
+    if after_delete:
+        print(
+            "\n".join(
+                f"  {it.name:10s} | {it.email or '-':20s} | {it.created_at}"
+                for it in after_delete
+            )
+        )
 
 
 async def main() -> None:
 
-    # Создание движка и сессии
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
-
     # Инициализация БД
-    await init_database(engine)
-
-    # Создание фабрики сессий
-    async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    await init_database(ENGINE)
 
-    async with async_session_maker() as session:
+    async with ASYNC_SESSION_MAKER() as session:
 
         await example_flow(session)
 
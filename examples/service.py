@@ -6,13 +6,22 @@
 """
 
 import asyncio
+from contextlib import aclosing
 from datetime import datetime
 from enum import StrEnum
+from functools import cache
+from typing import Any, ClassVar, Final
 
 from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy import Integer, String
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.pool import StaticPool
 
 from dplex import DPService, Order, Sort
 from dplex.dp_filters import DPFilters
@@ -96,12 +105,32 @@ class UserResponse(BaseModel):
 class UserFilterableFields(DPFilters[UserSortField]):
     """Схема для фильтрации пользователей"""
 
+    # Колонки для сортировки задаются один раз, без getattr по имени на каждый запрос
+    sort_map: ClassVar = {
+        UserSortField.ID: User.id,
+        UserSortField.NAME: User.name,
+        UserSortField.EMAIL: User.email,
+        UserSortField.AGE: User.age,
+        UserSortField.CREATED_AT: User.created_at,
+    }
+
     name: StringFilter | None = None
     email: StringFilter | None = None
     age: IntFilter | None = None
     created_at: DateTimeFilter | None = None
 
 
+# Пустой фильтр создаётся один раз и переиспользуется (только для чтения)
+EMPTY_FILTERS: Final = UserFilterableFields.model_construct()
+
+# Sort — неизменяемый dataclass, поэтому частые варианты сортировки
+# можно объявить один раз и переиспользовать во всех примерах
+SORT_ID_ASC: Final = Sort(by=UserSortField.ID, order=Order.ASC)
+SORT_NAME_ASC: Final = Sort(by=UserSortField.NAME, order=Order.ASC)
+SORT_AGE_DESC: Final = Sort(by=UserSortField.AGE, order=Order.DESC)
+SORT_CREATED_AT_DESC: Final = Sort(by=UserSortField.CREATED_AT, order=Order.DESC)
+
+
 # Сервис
 class UserService(
     DPService[
@@ -116,12 +145,48 @@ class UserService(
 ):
     """Сервис для работы с пользователями"""
 
-    pass
+    # UserResponse — плоская копия колонок User, повторная валидация не нужна
+    response_trusted = True
 
 
 # ==================== ПРИМЕРЫ СОЗДАНИЯ ====================
 
 
+def _trusted(**fields: Any) -> UserCreate:
+    """
+    Собрать UserCreate из доверенных литералов без валидации
+
+    Данные примеров заданы в коде и заведомо корректны, поэтому
+    model_construct пропускает проверки pattern/ge/le/min_length.
+    Для внешних данных используйте обычный конструктор UserCreate(...).
+    """
+    return UserCreate.model_construct(**fields)
+
+
+# Фикстуры примеров собираются один раз при импорте модуля
+BULK_USERS: Final = (
+    _trusted(name="Alice Smith", email="alice@example.com", age=28, bio="Designer"),
+    _trusted(name="Bob Johnson", email="bob@example.com", age=35, bio="Manager"),
+    _trusted(name="Carol White", email="carol@example.com", age=42),
+    _trusted(
+        name="David Brown", email="david@example.com", age=29, phone="+1111111111"
+    ),
+    _trusted(
+        name="Emma Davis",
+        email="emma@example.com",
+        age=31,
+        bio="Teacher",
+        phone="+2222222222",
+    ),
+)
+
+GMAIL_USERS: Final = (
+    _trusted(name="Ivan Petrov", email="ivan.petrov@gmail.com", age=25),
+    _trusted(name="Maria Sidorova", email="maria.sidorova@gmail.com", age=22),
+    _trusted(name="Alexey Ivanov", email="alexey.ivanov@gmail.com", age=33),
+)
+
+
 async def example_create_single(service: UserService) -> None:
     """
     Пример: Создать одного пользователя
@@ -140,7 +205,6 @@ async def example_create_single(service: UserService) -> None:
     )
 
     created_user = await service.create(new_user)
-    await service.session.commit()
 
     print("✓ Создан пользователь:")
     print(f"  ID: {created_user.id}")
@@ -160,30 +224,16 @@ async def example_create_bulk(service: UserService) -> None:
     """
     print("\n=== CREATE: Массовое создание (bulk) ===")
 
-    bulk_users = [
-        UserCreate(
-            name="Alice Smith", email="alice@example.com", age=28, bio="Designer"
-        ),
-        UserCreate(name="Bob Johnson", email="bob@example.com", age=35, bio="Manager"),
-        UserCreate(name="Carol White", email="carol@example.com", age=42),
-        UserCreate(
-            name="David Brown", email="david@example.com", age=29, phone="+1111111111"
-        ),
-        UserCreate(
-            name="Emma Davis",
-            email="emma@example.com",
-            age=31,
-            bio="Teacher",
-            phone="+2222222222",
-        ),
-    ]
-
-    created_users = await service.create_bulk(bulk_users)
-    await service.session.commit()
+    created_users = await service.create_bulk(list(BULK_USERS))
 
     print(f"✓ Массово создано {len(created_users)} пользователей:")
-    for user in created_users:
-        print(f"  - ID: {user.id}, Name: {user.name}, Age: {user.age}")
+    if created_users:
+        print(
+            "\n".join(
+                f"  - ID: {user.id}, Name: {user.name}, Age: {user.age}"
+                for user in created_users
+            )
+        )
 
 
 async def example_create_with_gmail(service: UserService) -> None:
@@ -194,18 +244,11 @@ async def example_create_with_gmail(service: UserService) -> None:
     """
     print("\n=== CREATE: Пользователи с Gmail ===")
 
-    gmail_users = [
-        UserCreate(name="Ivan Petrov", email="ivan.petrov@gmail.com", age=25),
-        UserCreate(name="Maria Sidorova", email="maria.sidorova@gmail.com", age=22),
-        UserCreate(name="Alexey Ivanov", email="alexey.ivanov@gmail.com", age=33),
-    ]
-
-    created_users = await service.create_bulk(gmail_users)
-    await service.session.commit()
+    created_users = await service.create_bulk(list(GMAIL_USERS))
 
     print(f"✓ Создано {len(created_users)} пользователей с Gmail:")
-    for user in created_users:
-        print(f"  - {user.name} ({user.email})")
+    if created_users:
+        print("\n".join(f"  - {user.name} ({user.email})" for user in created_users))
 
 
 # ==================== ПРИМЕРЫ ЧТЕНИЯ ====================
@@ -244,25 +287,32 @@ async def example_get_by_ids(service: UserService) -> None:
     users = await service.get_by_ids(user_ids)
 
     print(f"Запрошено {len(user_ids)} ID, найдено {len(users)} пользователей:")
-    for user in users:
-        print(f"  - ID: {user.id}, Name: {user.name}")
+    if users:
+        print("\n".join(f"  - ID: {user.id}, Name: {user.name}" for user in users))
 
 
 async def example_get_all_basic(service: UserService) -> None:
     """
     Пример: Получить всех пользователей без фильтров
 
-    Использует: get_all()
+    Использует: count(), stream_all()
     """
     print("\n=== READ: Все пользователи (без фильтров) ===")
 
-    filters = UserFilterableFields()
-    users = await service.get_all(filters)
+    total = await service.count()
 
-    print(f"✓ Всего пользователей в БД: {len(users)}")
+    print(f"✓ Всего пользователей в БД: {total}")
     print("Первые 5 пользователей:")
-    for user in users[:5]:
-        print(f"  - {user.name} ({user.email}), возраст: {user.age}")
+    # stream_all читает выборку частями: для показа хватает первой части
+    async with aclosing(service.stream_all(EMPTY_FILTERS, chunk_size=5)) as batches:
+        async for users in batches:
+            print(
+                "\n".join(
+                    f"  - {user.name} ({user.email}), возраст: {user.age}"
+                    for user in users
+                )
+            )
+            break
 
 
 async def example_get_all_with_filters(service: UserService) -> None:
@@ -277,15 +327,15 @@ async def example_get_all_with_filters(service: UserService) -> None:
     filters = UserFilterableFields(age=IntFilter(gte=30))
     users = await service.get_all(filters)
     print(f"✓ Пользователей 30+: {len(users)}")
-    for user in users[:3]:
-        print(f"  - {user.name}, возраст: {user.age}")
+    if users:
+        print("\n".join(f"  - {user.name}, возраст: {user.age}" for user in users[:3]))
 
     # Фильтр: имя содержит "John"
     filters = UserFilterableFields(name=StringFilter(contains="john"))
     users = await service.get_all(filters)
     print(f"\n✓ Пользователей с 'john' в имени: {len(users)}")
-    for user in users:
-        print(f"  - {user.name}")
+    if users:
+        print("\n".join(f"  - {user.name}" for user in users))
 
 
 async def example_get_all_with_sort(service: UserService) -> None:
@@ -297,52 +347,48 @@ async def example_get_all_with_sort(service: UserService) -> None:
     print("\n=== READ: Сортировка ===")
 
     # Сортировка по возрасту (по убыванию)
-    filters = UserFilterableFields(sort=Sort(by=UserSortField.AGE, order=Order.DESC))
+    filters = UserFilterableFields(sort=SORT_AGE_DESC)
     users = await service.get_all(filters)
 
     print("Пользователи, отсортированные по возрасту (убывание):")
-    for user in users[:5]:
-        print(f"  - {user.name}: {user.age} лет")
+    if users:
+        print("\n".join(f"  - {user.name}: {user.age} лет" for user in users[:5]))
 
     # Множественная сортировка
-    filters = UserFilterableFields(
-        sort=[
-            Sort(by=UserSortField.AGE, order=Order.DESC),
-            Sort(by=UserSortField.NAME, order=Order.ASC),
-        ]
-    )
+    filters = UserFilterableFields(sort=[SORT_AGE_DESC, SORT_NAME_ASC])
     users = await service.get_all(filters)
 
     print("\nПользователи (возраст DESC, имя ASC):")
-    for user in users[:5]:
-        print(f"  - {user.name}: {user.age} лет")
+    if users:
+        print("\n".join(f"  - {user.name}: {user.age} лет" for user in users[:5]))
 
 
 async def example_get_all_with_pagination(service: UserService) -> None:
     """
     Пример: Получить пользователей с пагинацией
 
-    Использует: get_all() с limit и offset
+    Использует: get_all_response() с limit и offset
     """
     print("\n=== READ: Пагинация ===")
 
+    # get_all_response читает только колонки UserResponse, без ORM объектов
     filters = UserFilterableFields(
         limit=5,
         offset=0,
-        sort=Sort(by=UserSortField.ID, order=Order.ASC),
+        sort=SORT_ID_ASC,
     )
-    users = await service.get_all(filters)
+    users = await service.get_all_response(filters)
 
     print(f"Первая страница (5 записей): {len(users)} пользователей")
-    for user in users:
-        print(f"  - ID: {user.id}, Name: {user.name}")
+    if users:
+        print("\n".join(f"  - ID: {user.id}, Name: {user.name}" for user in users))
 
     filters.offset = 5
-    users = await service.get_all(filters)
+    users = await service.get_all_response(filters)
 
     print(f"\nВторая страница (5 записей): {len(users)} пользователей")
-    for user in users:
-        print(f"  - ID: {user.id}, Name: {user.name}")
+    if users:
+        print("\n".join(f"  - ID: {user.id}, Name: {user.name}" for user in users))
 
 
 async def example_get_first(service: UserService) -> None:
@@ -370,7 +416,7 @@ async def example_count(service: UserService) -> None:
     """
     print("\n=== COUNT: Подсчет пользователей ===")
 
-    total = await service.count(UserFilterableFields())
+    total = await service.count(EMPTY_FILTERS)
     print(f"✓ Всего пользователей: {total}")
 
     filters = UserFilterableFields(age=IntFilter(gte=18))
@@ -429,9 +475,6 @@ async def example_update_by_id(service: UserService) -> None:
     update_data = UserUpdate(name="John Updated", age=31)
 
     updated_user = await service.update_by_id(user_id, update_data)
-    await service.session.commit()
-
-    updated_user = await service.get_by_id(user_id)
 
     if updated_user:
         print(f"✓ Обновлен пользователь ID={user_id}:")
@@ -454,9 +497,6 @@ async def example_update_with_null_marker(service: UserService) -> None:
     update_data = UserUpdate(name="Alice Updated", bio=None)  # Явно устанавливаем NULL
 
     updated_user = await service.update_by_id(user_id, update_data)
-    await service.session.commit()
-
-    updated_user = await service.get_by_id(user_id)
 
     if updated_user:
         print(f"✓ Обновлен пользователь ID={user_id}:")
@@ -479,9 +519,6 @@ async def example_update_multiple_nulls(service: UserService) -> None:
     update_data = UserUpdate(email=None, bio=None, phone=None)
 
     updated_user = await service.update_by_id(user_id, update_data)
-    await service.session.commit()
-
-    updated_user = await service.get_by_id(user_id)
 
     if updated_user:
         print(f"✓ Очищены поля для пользователя ID={user_id}:")
@@ -503,11 +540,7 @@ async def example_update_mixed(service: UserService) -> None:
     # Обновить name и age, очистить bio
     update_data = UserUpdate(name="David Mixed Update", age=30, bio=None)  # Очистить
 
-    await service.update_by_id(user_id, update_data)
-
-    updated_user = await service.get_by_id(user_id)
-
-    await service.session.commit()
+    updated_user = await service.update_by_id(user_id, update_data)
 
     if updated_user:
         print(f"✓ Смешанное обновление для ID={user_id}:")
@@ -528,8 +561,17 @@ async def example_update_by_ids(service: UserService) -> None:
     user_ids = [5, 6, 7]
     update_data = UserUpdate(is_active=True)
 
-    await service.update_by_ids(user_ids, update_data)
-    await service.session.commit()
+    # update_by_ids возвращает обновлённые записи (UPDATE ... RETURNING)
+    updated_users = await service.update_by_ids(user_ids, update_data)
+
+    print(f"✓ Обновлено {len(updated_users)} пользователей:")
+    if updated_users:
+        print(
+            "\n".join(
+                f"  - ID: {user.id}, Is Active: {user.is_active}"
+                for user in updated_users
+            )
+        )
 
 
 async def example_update_by_ids_with_null(service: UserService) -> None:
@@ -545,8 +587,15 @@ async def example_update_by_ids_with_null(service: UserService) -> None:
     # Очистить phone у всех
     update_data = UserUpdate(phone=None)
 
-    await service.update_by_ids(user_ids, update_data)
-    await service.session.commit()
+    updated_users = await service.update_by_ids(user_ids, update_data)
+
+    print(f"✓ Очищен phone у {len(updated_users)} пользователей:")
+    if updated_users:
+        print(
+            "\n".join(
+                f"  - ID: {user.id}, Phone: {user.phone}" for user in updated_users
+            )
+        )
 
 
 async def example_update_by_id_with_fields(service: UserService) -> None:
@@ -564,11 +613,7 @@ async def example_update_by_id_with_fields(service: UserService) -> None:
         name="Selective Update", age=99, is_active=False, bio="This will be ignored"
     )
 
-    await service.update_by_id(user_id, update_data)  # Только name
-
-    updated_user = await service.get_by_id(user_id)
-
-    await service.session.commit()
+    updated_user = await service.update_by_id(user_id, update_data)  # Только name
 
     if updated_user:
         print(f"✓ Обновлено только поле 'name' для ID={user_id}:")
@@ -592,13 +637,11 @@ async def example_delete_by_id(service: UserService) -> None:
     temp_user = await service.create(
         UserCreate(name="Temp User", email="temp@example.com", age=25)
     )
-    await service.session.commit()
     user_id = temp_user.id
 
     print(f"Создан временный пользователь ID={user_id}")
 
     deleted = await service.delete_by_id(user_id)
-    await service.session.commit()
 
     if deleted:
         print(f"✓ Пользователь ID={user_id} успешно удален")
@@ -624,13 +667,11 @@ async def example_delete_by_ids(service: UserService) -> None:
             UserCreate(name="Temp 3", email="temp3@example.com", age=27),
         ]
     )
-    await service.session.commit()
 
     user_ids = [u.id for u in temp_users]
     print(f"Создано {len(user_ids)} временных пользователей: {user_ids}")
 
     deleted_count = await service.delete_by_ids(user_ids)
-    await service.session.commit()
 
     print(f"✓ Удалено {deleted_count} пользователей")
 
@@ -642,16 +683,14 @@ async def example_paginate(service: UserService) -> None:
     """
     Пример: Пагинация
 
-    Использует: paginate()
+    Использует: paginate(), в том числе с заранее известным total_count
     """
     print("\n=== PAGINATE: Постраничная навигация ===")
 
     page = 1
     per_page = 5
 
-    filters = UserFilterableFields(
-        sort=Sort(by=UserSortField.CREATED_AT, order=Order.DESC)
-    )
+    filters = UserFilterableFields(sort=SORT_CREATED_AT_DESC)
 
     users, total_count = await service.paginate(page, per_page, filters)
     total_pages = (total_count + per_page - 1) // per_page
@@ -660,8 +699,17 @@ async def example_paginate(service: UserService) -> None:
     print(f"Всего записей: {total_count}")
     print(f"На текущей странице: {len(users)}")
 
-    for user in users:
-        print(f"  - ID: {user.id}, Name: {user.name}")
+    if users:
+        print("\n".join(f"  - ID: {user.id}, Name: {user.name}" for user in users))
+
+    # Остальные страницы: общее количество уже известно, COUNT не повторяется
+    for page in range(2, total_pages + 1):
+        users, _ = await service.paginate(
+            page, per_page, filters, total_count=total_count
+        )
+        print(f"\nСтраница {page} из {total_pages}: {len(users)} записей")
+        if users:
+            print("\n".join(f"  - ID: {user.id}, Name: {user.name}" for user in users))
 
 
 async def example_paginate_with_filters(service: UserService) -> None:
@@ -674,7 +722,7 @@ async def example_paginate_with_filters(service: UserService) -> None:
 
     filters = UserFilterableFields(
         age=IntFilter(gte=18),
-        sort=Sort(by=UserSortField.AGE, order=Order.DESC),
+        sort=SORT_AGE_DESC,
     )
 
     users, total_count = await service.paginate(1, 5, filters)
@@ -682,13 +730,34 @@ async def example_paginate_with_filters(service: UserService) -> None:
     print(f"Найдено совершеннолетних: {total_count}")
     print(f"Показано: {len(users)}")
 
-    for user in users:
-        print(f"  - {user.name}, возраст: {user.age}")
+    if users:
+        print("\n".join(f"  - {user.name}, возраст: {user.age}" for user in users))
 
 
 # ==================== ИНИЦИАЛИЗАЦИЯ БД ====================
 
 
+@cache
+def get_engine() -> AsyncEngine:
+    """
+    Движок БД, один на процесс
+
+    Пул соединений живёт вместе с движком, поэтому движок создаётся один раз
+    и переиспользуется, а не пересоздаётся на каждый вызов.
+    In-memory SQLite живёт внутри одного соединения: StaticPool держит его
+    открытым на всё время работы, схема создаётся один раз.
+    """
+    return create_async_engine(
+        "sqlite+aiosqlite:///:memory:", echo=False, poolclass=StaticPool
+    )
+
+
+@cache
+def get_session_maker() -> async_sessionmaker[AsyncSession]:
+    """Фабрика сессий поверх общего движка, одна на процесс"""
+    return async_sessionmaker(get_engine(), expire_on_commit=False)
+
+
 async def init_database(engine) -> None:
     """Создать все таблицы в БД"""
     async with engine.begin() as conn:
@@ -702,92 +771,89 @@ async def init_database(engine) -> None:
 async def run_all_examples() -> None:
     """Запустить все примеры"""
 
-    # Создание движка и сессии
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
-
     # Инициализация БД
-    await init_database(engine)
-
-    # Создание фабрики сессий
-    async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
-
-    async with async_session_maker() as session:
-        repository: DPRepo[User, int] = DPRepo(model=User, session=session)
-        service = UserService(repository, session, UserResponse)
-
-        print("=" * 70)
-        print("ПРИМЕРЫ ИСПОЛЬЗОВАНИЯ DPSERVICE")
-        print("=" * 70)
-
-        # ==================== CREATE ====================
-        print("\n" + "=" * 70)
-        print("РАЗДЕЛ 1: СОЗДАНИЕ (CREATE)")
-        print("=" * 70)
-
-        await example_create_single(service)
-        await example_create_bulk(service)
-        await example_create_with_gmail(service)
-
-        # ==================== READ ====================
-        print("\n" + "=" * 70)
-        print("РАЗДЕЛ 2: ЧТЕНИЕ (READ)")
-        print("=" * 70)
-
-        await example_get_by_id(service)
-        await example_get_by_ids(service)
-        await example_get_all_basic(service)
-        await example_get_all_with_filters(service)
-        await example_get_all_with_sort(service)
-        await example_get_all_with_pagination(service)
-        await example_get_first(service)
-
-        # ==================== COUNT/EXISTS ====================
-        print("\n" + "=" * 70)
-        print("РАЗДЕЛ 3: ПОДСЧЕТ И ПРОВЕРКА (COUNT/EXISTS)")
-        print("=" * 70)
-
-        await example_count(service)
-        await example_exists(service)
-        await example_exists_by_id(service)
-
-        # ==================== UPDATE ====================
-        print("\n" + "=" * 70)
-        print("РАЗДЕЛ 4: ОБНОВЛЕНИЕ (UPDATE)")
-        print("=" * 70)
-
-        await example_update_by_id(service)
-        await example_update_with_null_marker(service)
-        await example_update_multiple_nulls(service)
-        await example_update_mixed(service)
-        await example_update_by_ids(service)
-        await example_update_by_ids_with_null(service)
-        await example_update_by_id_with_fields(service)
-
-        # ==================== DELETE ====================
-        print("\n" + "=" * 70)
-        print("РАЗДЕЛ 5: УДАЛЕНИЕ (DELETE)")
-        print("=" * 70)
-
-        await example_delete_by_id(service)
-        await example_delete_by_ids(service)
-
-        # ==================== PAGINATION ====================
-        print("\n" + "=" * 70)
-        print("РАЗДЕЛ 6: ПАГИНАЦИЯ (PAGINATE)")
-        print("=" * 70)
-
-        await example_paginate(service)
-        await example_paginate_with_filters(service)
-
-        print("\n" + "=" * 70)
-        print("✓ ВСЕ ПРИМЕРЫ УСПЕШНО ЗАВЕРШЕНЫ")
-        print("=" * 70)
-        print("\nОСНОВНЫЕ ВОЗМОЖНОСТИ NULL МАРКЕРА:")
-        print("  1. Явная установка полей в NULL: field=NULL")
-        print("  2. Работает с update_by_id(), update_by_ids()")
-        print("  3. Работает с update_by_id_with_fields()")
-        print("  4. Отличается от не указанного поля (не обновляется)")
-        print("  5. Type-safe с использованием NullMarker в type hints")
+    await init_database(get_engine())
+
+    async with get_session_maker()() as session:
+        # Сервис только делает flush: все примеры идут в одной транзакции,
+        # которая фиксируется одним COMMIT при выходе из блока
+        async with session.begin():
+            repository: DPRepo[User, int] = DPRepo(model=User, session=session)
+            service = UserService(repository, session, UserResponse)
+
+            print("=" * 70)
+            print("ПРИМЕРЫ ИСПОЛЬЗОВАНИЯ DPSERVICE")
+            print("=" * 70)
+
+            # ==================== CREATE ====================
+            print("\n" + "=" * 70)
+            print("РАЗДЕЛ 1: СОЗДАНИЕ (CREATE)")
+            print("=" * 70)
+
+            await example_create_single(service)
+            await example_create_bulk(service)
+            await example_create_with_gmail(service)
+
+            # ==================== READ ====================
+            print("\n" + "=" * 70)
+            print("РАЗДЕЛ 2: ЧТЕНИЕ (READ)")
+            print("=" * 70)
+
+            await example_get_by_id(service)
+            await example_get_by_ids(service)
+            await example_get_all_basic(service)
+            await example_get_all_with_filters(service)
+            await example_get_all_with_sort(service)
+            await example_get_all_with_pagination(service)
+            await example_get_first(service)
+
+            # ==================== COUNT/EXISTS ====================
+            print("\n" + "=" * 70)
+            print("РАЗДЕЛ 3: ПОДСЧЕТ И ПРОВЕРКА (COUNT/EXISTS)")
+            print("=" * 70)
+
+            await example_count(service)
+            await example_exists(service)
+            await example_exists_by_id(service)
+
+            # ==================== UPDATE ====================
+            print("\n" + "=" * 70)
+            print("РАЗДЕЛ 4: ОБНОВЛЕНИЕ (UPDATE)")
+            print("=" * 70)
+
+            await example_update_by_id(service)
+            await example_update_with_null_marker(service)
+            await example_update_multiple_nulls(service)
+            await example_update_mixed(service)
+            await example_update_by_ids(service)
+            await example_update_by_ids_with_null(service)
+            await example_update_by_id_with_fields(service)
+
+            # ==================== DELETE ====================
+            print("\n" + "=" * 70)
+            print("РАЗДЕЛ 5: УДАЛЕНИЕ (DELETE)")
+            print("=" * 70)
+
+            await example_delete_by_id(service)
+            await example_delete_by_ids(service)
+
+            # ==================== PAGINATION ====================
+            print("\n" + "=" * 70)
+            print("РАЗДЕЛ 6: ПАГИНАЦИЯ (PAGINATE)")
+            print("=" * 70)
+
+            await example_paginate(service)
+            await example_paginate_with_filters(service)
+
+            print("\n" + "=" * 70)
+            print("✓ ВСЕ ПРИМЕРЫ УСПЕШНО ЗАВЕРШЕНЫ")
+            print("=" * 70)
+            print("\nОСНОВНЫЕ ВОЗМОЖНОСТИ NULL МАРКЕРА:")
+            print("  1. Явная установка полей в NULL: field=NULL")
+            print("  2. Работает с update_by_id(), update_by_ids()")
+            print("  3. Работает с update_by_id_with_fields()")
+            print("  4. Отличается от не указанного поля (не обновляется)")
+            print("  5. Type-safe с использованием NullMarker в type hints")
 
 
 if __name__ == "__main__":
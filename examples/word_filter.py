@@ -10,11 +10,13 @@ WordsFilter поддерживает указание колонок прямо
 import asyncio
 from datetime import datetime
 from enum import StrEnum
+from typing import Final
 
 from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy import Integer, String, event
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.pool import StaticPool
 
 from dplex import DPService, Order, Sort, WordsFilter
 from dplex.dp_filters import DPFilters
@@ -133,38 +135,61 @@ class UserService(
     # Теперь обработка WordsFilter выполняется автоматически через FilterApplier
     # если колонки указаны в самом фильтре. Метод apply_custom_filters больше не нужен.
 
+    response_trusted = True
+
 
 # ==================== ПРИМЕРЫ ИСПОЛЬЗОВАНИЯ ====================
 
+# Сколько найденных записей выводить: количество считается через count(),
+# а строки выбираются с LIMIT только для печати
+SHOW_LIMIT: Final = 10
+
 
 async def example_word_filter_basic(service: UserService) -> None:
     """
     Пример: Базовое использование WordsFilter
 
-    Использует: get_all() с WordsFilter
+    Использует: get_all_fields() с WordsFilter — для печати читаются
+    только name, email и bio
     """
     print("\n=== WORDS FILTER: Базовый поиск ===")
 
     # Поиск по одному слову (колонки указаны в фильтре)
     filters = UserFilters(
-        query=WordsFilter("john", columns=[User.name, User.email, User.bio])
+        query=WordsFilter("john", columns=[User.name, User.email, User.bio]),
+        limit=SHOW_LIMIT,
     )
-    users = await service.get_all(filters)
+    total = await service.count(filters)
 
-    print(f"✓ Найдено пользователей по запросу 'john': {len(users)}")
-    for user in users:
-        print(f"  - {user.name} ({user.email}) - {user.bio}")
+    print(f"✓ Найдено пользователей по запросу 'john': {total}")
+    if total:
+        print(
+            "\n".join(
+                f"  - {row['name']} ({row['email']}) - {row['bio']}"
+                for row in await service.get_all_fields(
+                    filters, User.name, User.email, User.bio
+                )
+            )
+        )
 
     # Поиск по нескольким словам (колонки указаны в фильтре)
     print("\n=== WORDS FILTER: Поиск по нескольким словам ===")
     filters = UserFilters(
-        query=WordsFilter("john developer", columns=[User.name, User.email, User.bio])
+        query=WordsFilter("john developer", columns=[User.name, User.email, User.bio]),
+        limit=SHOW_LIMIT,
     )
-    users = await service.get_all(filters)
+    total = await service.count(filters)
 
-    print(f"✓ Найдено пользователей по запросу 'john developer': {len(users)}")
-    for user in users:
-        print(f"  - {user.name} ({user.email}) - {user.bio}")
+    print(f"✓ Найдено пользователей по запросу 'john developer': {total}")
+    if total:
+        print(
+            "\n".join(
+                f"  - {row['name']} ({row['email']}) - {row['bio']}"
+                for row in await service.get_all_fields(
+                    filters, User.name, User.email, User.bio
+                )
+            )
+        )
 
 
 async def example_text_search(service: UserService) -> None:
@@ -180,8 +205,10 @@ async def example_text_search(service: UserService) -> None:
     print(
         f"✓ text_search='john' (поиск в name+email): найдено {len(users)} пользователей"
     )
-    for user in users:
-        print(f"  - {user.name} ({user.email}) - {user.bio}")
+    if users:
+        print(
+            "\n".join(f"  - {user.name} ({user.email}) - {user.bio}" for user in users)
+        )
 
 
 async def example_word_filter_with_none(service: UserService) -> None:
@@ -198,8 +225,8 @@ async def example_word_filter_with_none(service: UserService) -> None:
     filters = UserFilters(query=WordsFilter(None, None))
     users = await service.get_all(filters)
     print(f"✓ Найдено всех пользователей: {len(users)}")
-    for user in users:
-        print(f"  - {user.name} ({user.email})")
+    if users:
+        print("\n".join(f"  - {user.name} ({user.email})" for user in users))
 
     # Все пользователи (фильтр не применяется, так как text=None)
     print("\n2. Фильтр с text=None, но columns указаны (фильтр не применяется):")
@@ -208,8 +235,8 @@ async def example_word_filter_with_none(service: UserService) -> None:
     )
     users = await service.get_all(filters)
     print(f"✓ Найдено всех пользователей: {len(users)}")
-    for user in users:
-        print(f"  - {user.name} ({user.email})")
+    if users:
+        print("\n".join(f"  - {user.name} ({user.email})" for user in users))
 
     # Нормальный фильтр для сравнения
     print("\n4. Нормальный фильтр для сравнения (фильтр применяется):")
@@ -218,8 +245,8 @@ async def example_word_filter_with_none(service: UserService) -> None:
     )
     users = await service.get_all(filters)
     print(f"✓ Найдено пользователей по запросу 'john': {len(users)}")
-    for user in users:
-        print(f"  - {user.name} ({user.email})")
+    if users:
+        print("\n".join(f"  - {user.name} ({user.email})" for user in users))
 
 
 async def example_word_filter_combined(service: UserService) -> None:
@@ -236,12 +263,18 @@ async def example_word_filter_combined(service: UserService) -> None:
             "python developer", columns=[User.name, User.email, User.bio]
         ),
         age=IntFilter(gte=25),
+        limit=SHOW_LIMIT,
     )
-    users = await service.get_all(filters)
+    total = await service.count(filters)
 
-    print(f"✓ Найдено Python разработчиков 25+: {len(users)}")
-    for user in users:
-        print(f"  - {user.name}, возраст: {user.age}, bio: {user.bio}")
+    print(f"✓ Найдено Python разработчиков 25+: {total}")
+    if total:
+        print(
+            "\n".join(
+                f"  - {user.name}, возраст: {user.age}, bio: {user.bio}"
+                for user in await service.get_all(filters)
+            )
+        )
 
 
 async def example_word_filter_multiple_words(service: UserService) -> None:
@@ -254,13 +287,21 @@ async def example_word_filter_multiple_words(service: UserService) -> None:
 
     # Поиск по нескольким словам - все слова должны быть найдены (колонки указаны в фильтре)
     filters = UserFilters(
-        query=WordsFilter("alice gmail", columns=[User.name, User.email, User.bio])
+        query=WordsFilter("alice gmail", columns=[User.name, User.email, User.bio]),
+        limit=SHOW_LIMIT,
     )
-    users = await service.get_all(filters)
+    total = await service.count(filters)
 
-    print(f"✓ Найдено пользователей с 'alice' и 'gmail': {len(users)}")
-    for user in users:
-        print(f"  - {user.name} ({user.email}) - {user.bio}")
+    print(f"✓ Найдено пользователей с 'alice' и 'gmail': {total}")
+    if total:
+        print(
+            "\n".join(
+                f"  - {row['name']} ({row['email']}) - {row['bio']}"
+                for row in await service.get_all_fields(
+                    filters, User.name, User.email, User.bio
+                )
+            )
+        )
 
 
 async def example_word_filter_with_sort(service: UserService) -> None:
@@ -274,12 +315,18 @@ async def example_word_filter_with_sort(service: UserService) -> None:
     filters = UserFilters(
         query=WordsFilter("gmail", columns=[User.name, User.email, User.bio]),
         sort=Sort(by=UserSortField.NAME, order=Order.ASC),
+        limit=SHOW_LIMIT,
     )
-    users = await service.get_all(filters)
+    total = await service.count(filters)
 
-    print(f"✓ Найдено пользователей с Gmail (отсортировано по имени): {len(users)}")
-    for user in users:
-        print(f"  - {user.name} ({user.email})")
+    print(f"✓ Найдено пользователей с Gmail (отсортировано по имени): {total}")
+    if total:
+        print(
+            "\n".join(
+                f"  - {user.name} ({user.email})"
+                for user in await service.get_all(filters)
+            )
+        )
 
 
 async def example_word_filter_count(service: UserService) -> None:
@@ -322,8 +369,8 @@ async def example_word_filter_conditional(service: UserService) -> None:
     print(
         f"✓ Найдено пользователей (фильтр по словам не применен, только по возрасту): {len(users)}"
     )
-    for user in users:
-        print(f"  - {user.name}, возраст: {user.age}")
+    if users:
+        print("\n".join(f"  - {user.name}, возраст: {user.age}" for user in users))
 
     # Теперь с реальным текстом
     search_text = "developer"
@@ -334,12 +381,24 @@ async def example_word_filter_conditional(service: UserService) -> None:
     users = await service.get_all(filters)
 
     print(f"\n✓ Найдено разработчиков 25+: {len(users)}")
-    for user in users:
-        print(f"  - {user.name}, возраст: {user.age}, bio: {user.bio}")
+    if users:
+        print(
+            "\n".join(
+                f"  - {user.name}, возраст: {user.age}, bio: {user.bio}"
+                for user in users
+            )
+        )
 
 
 # ==================== ИНИЦИАЛИЗАЦИЯ БД ====================
 
+# In-memory SQLite живёт внутри одного соединения: StaticPool держит его
+# открытым на всё время работы. Для серверных БД используйте пул по умолчанию
+ENGINE = create_async_engine(
+    "sqlite+aiosqlite:///:memory:", echo=False, poolclass=StaticPool
+)
+ASYNC_SESSION_MAKER = async_sessionmaker(ENGINE, expire_on_commit=False)
+
 
 async def init_database(engine) -> None:
     """Создать все таблицы в БД"""
@@ -350,86 +409,83 @@ async def init_database(engine) -> None:
 
 # ==================== ГЛАВНАЯ ФУНКЦИЯ ====================
 
+TEST_USERS: Final = (
+    UserCreate.model_construct(
+        name="John Doe",
+        email="john.doe@example.com",
+        age=30,
+        bio="Python Developer",
+    ),
+    UserCreate.model_construct(
+        name="Jane Smith",
+        email="jane.smith@gmail.com",
+        age=25,
+        bio="JavaScript Developer",
+    ),
+    UserCreate.model_construct(
+        name="Bob Johnson",
+        email="bob.johnson@example.com",
+        age=35,
+        bio="Full Stack Developer",
+    ),
+    UserCreate.model_construct(
+        name="Alice Brown",
+        email="alice.brown@gmail.com",
+        age=28,
+        bio="Data Scientist",
+    ),
+)
+
+# Баннеры собираются один раз при импорте и печатаются одним вызовом
+BANNER: Final = "=" * 70
+HEADER: Final = f"{BANNER}\nПРИМЕРЫ ИСПОЛЬЗОВАНИЯ WORDS FILTER\n{BANNER}"
+FOOTER: Final = "\n".join(
+    (
+        f"\n{BANNER}",
+        "✓ ВСЕ ПРИМЕРЫ УСПЕШНО ЗАВЕРШЕНЫ",
+        BANNER,
+        "\nОСНОВНЫЕ ВОЗМОЖНОСТИ WORDS FILTER:",
+        "  1. Поля в схеме фильтрации, которых нет в модели",
+        "  2. WordsFilter с указанием колонок обрабатывается автоматически",
+        "  3. Можно комбинировать с обычными фильтрами",
+        "  4. Разбивка строки на слова и поиск каждого слова в разных колонках",
+        "  5. AND между словами (все слова должны быть найдены)",
+        "  6. OR между колонками (слово может быть в любой колонке)",
+        "  7. Колонки указываются прямо в WordsFilter при создании",
+        "  8. Поддержка None для text и columns - фильтр не применяется, если любой из них None",
+        "  9. Упрощенное использование - можно передать None без дополнительных проверок",
+    )
+)
+
 
 async def run_examples() -> None:
     """Запустить все примеры"""
 
-    # Создание движка и сессии
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
-
     # Инициализация БД
-    await init_database(engine)
-
-    # Создание фабрики сессий
-    async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
-
-    async with async_session_maker() as session:
-        repository: DPRepo[User, int] = DPRepo(model=User, session=session)
-        service = UserService(repository, session, UserResponse)
-
-        # Создаем тестовые данные
-        test_users = [
-            UserCreate(
-                name="John Doe",
-                email="john.doe@example.com",
-                age=30,
-                bio="Python Developer",
-            ),
-            UserCreate(
-                name="Jane Smith",
-                email="jane.smith@gmail.com",
-                age=25,
-                bio="JavaScript Developer",
-            ),
-            UserCreate(
-                name="Bob Johnson",
-                email="bob.johnson@example.com",
-                age=35,
-                bio="Full Stack Developer",
-            ),
-            UserCreate(
-                name="Alice Brown",
-                email="alice.brown@gmail.com",
-                age=28,
-                bio="Data Scientist",
-            ),
-        ]
-
-        created_users = await service.create_bulk(test_users)
-        await service.session.commit()
-
-        print("=" * 70)
-        print("ПРИМЕРЫ ИСПОЛЬЗОВАНИЯ WORDS FILTER")
-        print("=" * 70)
-        print(f"\n✓ Создано {len(created_users)} тестовых пользователей")
-
-        # Запускаем примеры
-        await example_word_filter_basic(service)
-        await example_text_search(service)
-        await example_word_filter_with_none(service)
-        await example_word_filter_combined(service)
-        await example_word_filter_multiple_words(service)
-        await example_word_filter_with_sort(service)
-        await example_word_filter_count(service)
-        await example_word_filter_conditional(service)
-
-        print("\n" + "=" * 70)
-        print("✓ ВСЕ ПРИМЕРЫ УСПЕШНО ЗАВЕРШЕНЫ")
-        print("=" * 70)
-        print("\nОСНОВНЫЕ ВОЗМОЖНОСТИ WORDS FILTER:")
-        print("  1. Поля в схеме фильтрации, которых нет в модели")
-        print("  2. WordsFilter с указанием колонок обрабатывается автоматически")
-        print("  3. Можно комбинировать с обычными фильтрами")
-        print("  4. Разбивка строки на слова и поиск каждого слова в разных колонках")
-        print("  5. AND между словами (все слова должны быть найдены)")
-        print("  6. OR между колонками (слово может быть в любой колонке)")
-        print("  7. Колонки указываются прямо в WordsFilter при создании")
-        print(
-            "  8. Поддержка None для text и columns - фильтр не применяется, если любой из них None"
-        )
-        print(
-            "  9. Упрощенное использование - можно передать None без дополнительных проверок"
-        )
+    await init_database(ENGINE)
+
+    async with ASYNC_SESSION_MAKER() as session:
+        async with session.begin():
+            repository: DPRepo[User, int] = DPRepo(model=User, session=session)
+            service = UserService(repository, session, UserResponse)
+
+            # Создаем тестовые данные
+            created_users = await service.create_bulk(list(TEST_USERS))
+
+            print(HEADER)
+            print(f"\n✓ Создано {len(created_users)} тестовых пользователей")
+
+            # Запускаем примеры
+            await example_word_filter_basic(service)
+            await example_text_search(service)
+            await example_word_filter_with_none(service)
+            await example_word_filter_combined(service)
+            await example_word_filter_multiple_words(service)
+            await example_word_filter_with_sort(service)
+            await example_word_filter_count(service)
+            await example_word_filter_conditional(service)
+
+            print(FOOTER)
 
 
 if __name__ == "__main__":